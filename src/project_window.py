@@ -479,7 +479,7 @@ class ProjectWindow(Adw.ApplicationWindow):
         box.set_size_request(260, -1)
 
         # Check if this is a git repo
-        self.git_service = GitService(self.project_path)
+        self.git_service = GitService.get_or_create(self.project_path)
         self._is_git_repo = self.git_service.is_git_repo()
         if self._is_git_repo:
             self.git_service.open()
@@ -2540,28 +2540,42 @@ class ProjectWindow(Adw.ApplicationWindow):
 
     def _collect_file_list(self) -> list[Path]:
         """Collect all files from project, respecting gitignore."""
-        files = []
+        files: list[tuple[float, str]] = []  # (mtime, path)
         show_ignored = self.show_ignored_btn.get_active()
-
-        # Walk the directory tree
-        for path in self.project_path.rglob("*"):
-            if not path.is_file():
-                continue
-
-            # Skip hidden files/folders
-            if any(part.startswith(".") for part in path.relative_to(self.project_path).parts):
-                continue
-
-            # Check gitignore patterns using file tree's method
-            if not show_ignored and self.file_tree._is_ignored(path):
+        is_ignored = self.file_tree._is_ignored
+
+        # Walk the directory tree with scandir, pruning hidden and ignored
+        # folders (.git, node_modules) instead of enumerating and discarding
+        # everything below them; the dirent already says file or folder
+        stack = [(str(self.project_path), "")]
+        while stack:
+            directory, rel_prefix = stack.pop()
+            try:
+                it = os.scandir(directory)
+            except OSError:
                 continue
-
-            files.append(path)
+            with it:
+                for entry in it:
+                    # Skip hidden files/folders
+                    if entry.name.startswith("."):
+                        continue
+                    rel_path = rel_prefix + entry.name
+                    # A broken symlink or a file removed mid-scan only drops itself
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Check gitignore patterns using file tree's method
+                            if show_ignored or not is_ignored(rel_path, True):
+                                stack.append((entry.path, rel_path + "/"))
+                        elif entry.is_file():
+                            if show_ignored or not is_ignored(rel_path, False):
+                                files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
 
         # Sort by modification time (most recent first)
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        files.sort(reverse=True)
 
-        return files
+        return [Path(path) for _mtime, path in files]
 
     def _on_file_search_selected(self, dialog, file_path: str):
         """Handle file selection from search dialog."""
@@ -15,7 +15,7 @@ from .project_lock import ProjectLock
 from .project_status_service import ProjectStatusService, LocalStatus, RemoteStatus
 from .session_insight_service import SessionInsightService
 from .tasks_service import TasksService, Task, TaskInput
-from .git_service import GitService, GitFileStatus, FileStatus, GitCommit, AuthenticationRequired, PushRejected
+from .git_service import GitService, GitFileStatus, FileStatus, GitCommit, StatusSnapshot, AuthenticationRequired, PushRejected
 from .issues_service import IssuesService, Issue, IssueComment, PullRequest, GitHubError
 from .icon_cache import IconCache
 from .toast_service import ToastService
@@ -57,6 +57,7 @@ __all__ = [
     "GitFileStatus",
     "FileStatus",
     "GitCommit",
+    "StatusSnapshot",
     "AuthenticationRequired",
     "PushRejected",
     "CredentialService",
@@ -2,9 +2,13 @@
 
 import os
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 
 import pygit2
@@ -46,6 +50,23 @@ class GitFileStatus:
     status: FileStatus
     staged: bool
     old_path: str | None = None  # For renames
+    # Basename of ``path``, computed once at parse time for row labels and icons
+    display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # git paths are always "/"-separated and relative
+        self.display_name = self.path.rpartition("/")[2]
+
+
+@dataclass
+class StatusSnapshot:
+    """Branch, upstream tracking and change lists from a single ``git status``."""
+    branch: str  # "HEAD" when detached
+    upstream: str  # short name (e.g. "origin/main"); "" if unset or gone
+    ahead: int
+    behind: int
+    staged: list[GitFileStatus]
+    unstaged: list[GitFileStatus]
 
 
 @dataclass
@@ -58,14 +79,43 @@ class GitCommit:
     author_email: str
     timestamp: datetime
     is_head: bool
+    # Lowercased message, author and short hash, matched by the history filter
+    search_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.search_key = f"{self.message}\n{self.author}\n{self.short_hash}".lower()
 
 
 class GitService:
     """Service for git operations using pygit2."""
 
+    # Shared instances by path (see get_or_create); held weakly, so a project's
+    # entry goes away with its last window.
+    _instances: "weakref.WeakValueDictionary[Path, GitService]" = weakref.WeakValueDictionary()
+
     def __init__(self, repo_path: Path | str):
         self.repo_path = Path(repo_path)
         self._repo: pygit2.Repository | None = None
+        self._git_dir: str | None = None
+        # Worker threads' own Repository handles (see repo)
+        self._thread_repos = threading.local()
+
+    @classmethod
+    def get_or_create(cls, repo_path: Path | str) -> "GitService":
+        """The shared service for ``repo_path``, created on first use.
+
+        The long-lived views of a project window (file tree, notes, changes,
+        the window itself) share one libgit2 Repository — object cache, odb
+        and refdb handles — instead of opening one each, on the main thread;
+        their workers get handles of their own (see repo). One-off callers can
+        keep constructing their own.
+        """
+        path = Path(repo_path)
+        service = cls._instances.get(path)
+        if service is None:
+            service = cls(path)
+            cls._instances[path] = service
+        return service
 
     def is_git_repo(self) -> bool:
         """Check if path is inside a git repository."""
@@ -76,11 +126,17 @@ class GitService:
             return False
 
     def open(self) -> bool:
-        """Open the repository. Returns True if successful."""
+        """Open the repository. Returns True if successful.
+
+        A no-op once open, so every user of a shared instance can call it.
+        """
+        if self._repo is not None:
+            return True
         try:
             repo_path = pygit2.discover_repository(str(self.repo_path))
             if repo_path:
                 self._repo = pygit2.Repository(repo_path)
+                self._git_dir = repo_path
                 return True
         except pygit2.GitError:
             pass
@@ -88,11 +144,22 @@ class GitService:
 
     @property
     def repo(self) -> pygit2.Repository:
-        """Get repository, opening if needed."""
+        """Get repository, opening if needed.
+
+        A libgit2 Repository and its index must not be used by several threads
+        at once, so only the main thread gets the shared handle; any other
+        thread (background refreshes, history reads) opens one of its own,
+        which goes away with the thread.
+        """
         if self._repo is None:
             if not self.open():
                 raise RuntimeError("Not a git repository")
-        return self._repo
+        if threading.current_thread() is threading.main_thread():
+            return self._repo
+        repo = getattr(self._thread_repos, "repo", None)
+        if repo is None:
+            repo = self._thread_repos.repo = pygit2.Repository(self._git_dir)
+        return repo
 
     def get_branch_name(self) -> str:
         """Get current branch name or HEAD commit if detached."""
@@ -114,7 +181,8 @@ class GitService:
         "?": FileStatus.UNTRACKED,
     }
 
-    def get_porcelain_status(self, env=None) -> tuple[list[GitFileStatus], list[GitFileStatus]]:
+    def get_porcelain_status(self, env=None, cancel: threading.Event | None = None,
+                             ) -> tuple[list[GitFileStatus], list[GitFileStatus]]:
         """The single source of truth for working-tree status: (staged, unstaged).
 
         Uses ``git status --porcelain -z`` (reads the on-disk index, so it stays
@@ -123,18 +191,91 @@ class GitService:
         notes-panel badges and the pull pre-check can never disagree.
 
         Raises ``RuntimeError`` if git fails, so callers surface it (roadmap 3.2)
-        rather than reading a failure as "no changes".
+        rather than reading a failure as "no changes". Setting ``cancel`` kills
+        the git process, which also raises ``RuntimeError``.
         """
-        result = subprocess.run(
-            ["git", "status", "--porcelain", "-z"],
-            capture_output=True, cwd=str(self.repo_path), timeout=30,
-            env=env or git_auth.build_git_env(),
-        )
-        if result.returncode != 0:
+        return self._parse_porcelain(self._run_status(env, cancel=cancel))
+
+    def get_status_snapshot(self, env=None, cancel: threading.Event | None = None) -> StatusSnapshot:
+        """Status plus branch and ahead/behind from one ``git status --branch`` run.
+
+        Saves the changes panel the separate branch / upstream / rev-list processes.
+        The entries go through the same porcelain parser as get_porcelain_status.
+        Raises ``RuntimeError`` if git fails or ``cancel`` is set.
+        """
+        data = self._run_status(env, "--branch", cancel=cancel)
+        header = b""
+        if data.startswith(b"## "):
+            header, _, data = data.partition(b"\x00")
+        branch, upstream, ahead, behind = self._parse_branch_header(
+            header[3:].decode("utf-8", errors="replace"))
+        staged, unstaged = self._parse_porcelain(data)
+        return StatusSnapshot(branch, upstream, ahead, behind, staged, unstaged)
+
+    # Seconds between checks of a status read's cancel event
+    _STATUS_CANCEL_POLL = 0.05
+
+    def _run_status(self, env=None, *extra_args: str,
+                    cancel: threading.Event | None = None) -> bytes:
+        """Run ``git status --porcelain -z``; raise ``RuntimeError`` on failure.
+
+        No optional locks: status runs in the background, so it must neither take
+        index.lock from under the user's own git commands nor rewrite .git/index,
+        whose monitor would report that as a status change and refresh again.
+        A set ``cancel`` event kills git mid-run (status on a huge tree can take
+        seconds).
+        """
+        args = ["git", "--no-optional-locks", "status", "--porcelain", "-z", *extra_args]
+        kwargs = dict(cwd=str(self.repo_path), env=env or git_auth.build_git_env())
+        if cancel is None:
+            result = subprocess.run(args, capture_output=True, timeout=30, **kwargs)
+            stdout, stderr, returncode = result.stdout, result.stderr, result.returncode
+        else:
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    stdout, stderr = proc.communicate(timeout=self._STATUS_CANCEL_POLL)
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancel.is_set() or time.monotonic() > deadline:
+                        proc.kill()
+                        proc.communicate()
+                        raise RuntimeError(
+                            "git status cancelled" if cancel.is_set() else "git status timed out")
+            returncode = proc.returncode
+        if returncode != 0:
             raise RuntimeError(
-                result.stderr.decode("utf-8", errors="replace").strip() or "git status failed"
+                stderr.decode("utf-8", errors="replace").strip() or "git status failed"
             )
-        return self._parse_porcelain(result.stdout)
+        return stdout
+
+    @staticmethod
+    def _parse_branch_header(head: str) -> tuple[str, str, int, int]:
+        """Parse a porcelain ``## ...`` line (without the ``## ``).
+
+        Returns (branch, upstream, ahead, behind). Forms: ``main``,
+        ``main...origin/main [ahead 1, behind 2]``, ``main...origin/main [gone]``,
+        ``No commits yet on main`` and ``HEAD (no branch)``.
+        """
+        for prefix in ("No commits yet on ", "Initial commit on "):
+            if head.startswith(prefix):
+                return head[len(prefix):], "", 0, 0
+        if head.startswith("HEAD (no branch)"):
+            return "HEAD", "", 0, 0
+        # Ref names cannot contain "..", so the first "..." splits branch/upstream.
+        head, _, tracking = head.partition(" [")
+        branch, _, upstream = head.partition("...")
+        ahead = behind = 0
+        for part in tracking.rstrip("]").split(", "):
+            name, _, count = part.partition(" ")
+            if name == "gone":
+                upstream = ""
+            elif name == "ahead":
+                ahead = int(count)
+            elif name == "behind":
+                behind = int(count)
+        return branch or "?", upstream, ahead, behind
 
     @classmethod
     def _parse_porcelain(cls, data: bytes) -> tuple[list[GitFileStatus], list[GitFileStatus]]:
@@ -380,6 +521,28 @@ class GitService:
 
         return (0, 0)
 
+    def is_ignored_untracked(self, path: str) -> bool:
+        """Check if an absolute path is gitignored and untracked.
+
+        Such a path can never show up in ``git status``. Tracked files that match
+        an ignore rule still count as changeable. Best-effort: False on error.
+        """
+        try:
+            # Runs per working-tree event path: slice off the workdir prefix
+            # (libgit2 keeps a trailing separator) instead of os.path.relpath,
+            # which normalizes both paths and calls getcwd() each time.
+            workdir = self.repo.workdir
+            if not workdir or not path.startswith(workdir):
+                return False
+            rel_path = path[len(workdir):]
+            if not rel_path or not self.repo.path_is_ignored(rel_path):
+                return False
+            index = self.repo.index
+            index.read(False)  # re-reads only if the index file changed
+            return rel_path not in index
+        except (pygit2.GitError, RuntimeError, OSError, ValueError):
+            return False
+
     def has_uncommitted_changes(self) -> bool:
         """Check if there are uncommitted changes (staged or unstaged)."""
         try:
@@ -533,31 +696,74 @@ class GitService:
 
     # ==================== History Methods ====================
 
-    def get_commits(self, limit: int = 50) -> list[GitCommit]:
-        """Get recent commits from current branch."""
-        commits = []
+    # Newest first, children always before parents: time alone leaves commits
+    # made within the same second in arbitrary order.
+    _HISTORY_SORT = pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME
+
+    def get_commits(self, limit: int = 50, known: list[GitCommit] | None = None) -> list[GitCommit]:
+        """Get recent commits from current branch.
 
+        ``known`` is the list a previous call returned. If HEAD has only moved
+        forward since and every new commit descends from the old head (new
+        commits, a fast-forward pull), just the new commits are walked and put
+        in front of it; topological order places them there in a full walk too.
+        Anything else (a merge of older work, reset, rebase, checkout
+        elsewhere) walks anew.
+        """
         try:
             head_oid = self.repo.head.target
         except pygit2.GitError:
-            return commits
+            return []
 
-        for commit in self.repo.walk(head_oid, pygit2.GIT_SORT_TIME):
-            if len(commits) >= limit:
-                break
+        if known and known[0].is_head:
+            fresh = self._commits_since(head_oid, known[0].hash, limit)
+            if fresh is not None:
+                previous = [replace(c, is_head=c.is_head and not fresh) for c in known]
+                return (fresh + previous)[:limit]
 
-            git_commit = GitCommit(
-                hash=str(commit.id),
-                short_hash=str(commit.id)[:7],
-                message=commit.message.strip(),
-                author=commit.author.name,
-                author_email=commit.author.email,
-                timestamp=datetime.fromtimestamp(commit.commit_time),
-                is_head=(commit.id == head_oid),
-            )
-            commits.append(git_commit)
+        walker = self.repo.walk(head_oid, self._HISTORY_SORT)
+        return [self._make_commit(commit, head_oid) for commit in islice(walker, limit)]
 
-        return commits
+    def _commits_since(self, head_oid, known_hash: str, limit: int) -> list[GitCommit] | None:
+        """Commits reachable from HEAD but not from ``known_hash``, newest first.
+
+        None unless all of them descend from ``known_hash`` and there are
+        fewer than ``limit`` (beyond that a full walk is no more work).
+        """
+        try:
+            known_oid = pygit2.Oid(hex=known_hash)
+            if head_oid == known_oid:
+                return []
+            walker = self.repo.walk(head_oid, self._HISTORY_SORT)
+            walker.hide(known_oid)
+            commits = list(islice(walker, limit))
+        except (pygit2.GitError, ValueError, KeyError):
+            return None
+        if not commits or len(commits) >= limit:
+            return None  # HEAD went back to an ancestor, or too far ahead
+
+        # Parents come after children, so walking backwards each commit's
+        # parents have been classified already.
+        descendants = {known_oid}
+        for commit in reversed(commits):
+            if not any(parent in descendants for parent in commit.parent_ids):
+                return None
+            descendants.add(commit.id)
+        return [self._make_commit(commit, head_oid) for commit in commits]
+
+    @staticmethod
+    def _make_commit(commit: pygit2.Commit, head_oid) -> GitCommit:
+        """GitCommit for a pygit2 commit."""
+        commit_hash = str(commit.id)
+        return GitCommit(
+            hash=commit_hash,
+            short_hash=commit_hash[:7],
+            message=commit.message.strip(),
+            author=commit.author.name,
+            author_email=commit.author.email,
+            timestamp=datetime.fromtimestamp(commit.commit_time),
+            is_head=(commit.id == head_oid),
+        )
 
     def get_commit(self, commit_hash: str) -> GitCommit | None:
         """Get a single commit by hash."""
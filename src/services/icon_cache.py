@@ -1,5 +1,6 @@
 """Icon cache service for fast file/folder icon lookup."""
 
+import os
 from pathlib import Path
 from typing import ClassVar
 
@@ -18,6 +19,9 @@ class IconCache:
     _instance: ClassVar["IconCache | None"] = None
     _initialized: bool = False
 
+    # Max memoized name -> GIcon answers before the memo is dropped and refilled
+    NAME_GICON_CACHE_MAX: ClassVar[int] = 4096
+
     # Extension to icon name mapping
     EXTENSION_MAP: ClassVar[dict[str, str]] = {
         # Python
@@ -553,6 +557,18 @@ class IconCache:
         "demos": "examples",
     }
 
+    # Extension to test-file icon name mapping (for *.test.*, *.spec.*, *_test.*)
+    TEST_EXTENSION_MAP: ClassVar[dict[str, str]] = {
+        ".ts": "test-ts",
+        ".mts": "test-ts",
+        ".cts": "test-ts",
+        ".tsx": "test-tsx",
+        ".js": "test-js",
+        ".mjs": "test-js",
+        ".cjs": "test-js",
+        ".jsx": "test-jsx",
+    }
+
     def __new__(cls) -> "IconCache":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -564,8 +580,10 @@ class IconCache:
         self._initialized = True
 
         self._cache: dict[str, Gdk.Texture] = {}
+        self._gicons: dict[str, Gio.Icon] = {}
         self._icons_dir = Path(__file__).parent.parent / "resources" / "icons"
         self._load_icons()
+        self._build_gicon_tables()
 
     def _load_icons(self) -> None:
         """Pre-load all SVG icons into memory."""
@@ -579,7 +597,50 @@ class IconCache:
                 texture = Gdk.Texture.new_from_file(gfile)
                 self._cache[name] = texture
             except GLib.Error:
-                pass
+                continue
+            self._gicons[name] = Gio.FileIcon.new(gfile)
+
+    def _build_gicon_tables(self) -> None:
+        """Precompute flat GIcon lookup tables for the fixed icon set.
+
+        Resolving an icon through `get_gicon()` parses the path and stats the SVG
+        on every call; the file tree does that once per row. Everything it needs
+        is known once the icons are loaded, so the answers are tabulated here and
+        `get_gicon_for_name()` / `get_gicon_for_ext()` become plain dict hits.
+        """
+        gicons = self._gicons
+        file_default = gicons.get("file")
+        folder = gicons.get("folder")
+        folder_open = gicons.get("folder-open", folder)
+
+        # (ext, is_dir, is_open) -> GIcon; folders are keyed with an empty ext
+        self._ext_gicons: dict[tuple[str, bool, bool], Gio.Icon | None] = {
+            ("", True, False): folder,
+            ("", True, True): folder_open,
+        }
+        for ext, icon_name in self.EXTENSION_MAP.items():
+            self._ext_gicons[(ext, False, False)] = gicons.get(icon_name, file_default)
+        self._default_file_gicon = file_default
+
+        # Exact filename -> GIcon (only names whose SVG actually exists)
+        self._filename_gicons: dict[str, Gio.Icon] = {
+            name: gicons[icon_name]
+            for name, icon_name in self.FILENAME_MAP.items()
+            if icon_name in gicons
+        }
+
+        # (lowercase folder name, is_open) -> GIcon, with the same fallbacks
+        # as get_folder_gicon()
+        self._folder_gicons: dict[tuple[str, bool], Gio.Icon | None] = {}
+        for name, icon_key in self.FOLDER_MAP.items():
+            icon_base = f"folder-{icon_key}"
+            self._folder_gicons[(name, False)] = gicons.get(icon_base, folder)
+            self._folder_gicons[(name, True)] = gicons.get(
+                f"{icon_base}-open", gicons.get(icon_base, folder_open)
+            )
+
+        # (name, is_dir, is_open) -> resolved GIcon, filled by get_gicon_for_name()
+        self._name_gicons: dict[tuple[str, bool, bool], Gio.Icon | None] = {}
 
     def get_file_icon(self, path: Path) -> Gdk.Texture | None:
         """Get icon texture for a file path.
@@ -778,6 +839,72 @@ class IconCache:
         else:
             return self.get_file_gicon(path)
 
+    def get_gicon_for_ext(self, ext: str, is_dir: bool, is_open: bool = False) -> Gio.Icon | None:
+        """Get Gio.Icon by lowercase extension from the precomputed table.
+
+        Args:
+            ext: Lowercase extension including the dot (e.g. ".py"); ignored for folders
+            is_dir: Whether the entry is a folder
+            is_open: Whether the folder is expanded (ignored for files)
+
+        Returns:
+            Gio.FileIcon pointing to the SVG, or None if not found
+        """
+        if is_dir:
+            return self._ext_gicons[("", True, is_open)]
+        return self._ext_gicons.get((ext, False, False), self._default_file_gicon)
+
+    def get_gicon_for_name(self, name: str, is_dir: bool, is_open: bool = False) -> Gio.Icon | None:
+        """Get Gio.Icon for a bare file/folder name without touching the filesystem.
+
+        Same resolution order as `get_file_gicon()` / `get_folder_gicon()`, but the
+        caller supplies `is_dir` (e.g. from a directory scan) so no stat is needed.
+
+        Args:
+            name: File or folder name (basename, not a path)
+            is_dir: Whether the entry is a folder
+            is_open: Whether the folder is expanded (ignored for files)
+
+        Returns:
+            Gio.FileIcon pointing to the SVG, or None if not found
+        """
+        # Names repeat across rows and refreshes (__init__.py, src, README.md);
+        # memoize so each is resolved once
+        key = (name, is_dir, is_open and is_dir)
+        try:
+            return self._name_gicons[key]
+        except KeyError:
+            pass
+        gicon = self._resolve_gicon_for_name(name, is_dir, is_open)
+        if len(self._name_gicons) >= self.NAME_GICON_CACHE_MAX:
+            self._name_gicons.clear()
+        self._name_gicons[key] = gicon
+        return gicon
+
+    def _resolve_gicon_for_name(self, name: str, is_dir: bool, is_open: bool) -> Gio.Icon | None:
+        """Resolve `get_gicon_for_name()` from the precomputed tables."""
+        if is_dir:
+            gicon = self._folder_gicons.get((name.lower(), is_open))
+            if gicon is not None:
+                return gicon
+            return self._ext_gicons[("", True, is_open)]
+
+        gicon = self._filename_gicons.get(name)
+        if gicon is not None:
+            return gicon
+
+        name_lower = name.lower()
+        ext = os.path.splitext(name_lower)[1]
+        if ".test." in name_lower or ".spec." in name_lower or "_test." in name_lower:
+            test_icon = self.TEST_EXTENSION_MAP.get(ext)
+            if test_icon and test_icon in self._gicons:
+                return self._gicons[test_icon]
+
+        if name.endswith(".d.ts") and "typescript-def" in self._gicons:
+            return self._gicons["typescript-def"]
+
+        return self.get_gicon_for_ext(ext, False)
+
     def get_provider_texture(self, icon_name: str) -> Gdk.Texture | None:
         """Get Gdk.Texture for AI provider icon.
 
@@ -24,23 +24,29 @@ def parse_iso(value: str) -> datetime | None:
         return None
 
 
-def humanize_relative(dt: datetime | None) -> str:
+def humanize_relative(dt: datetime | None, now: datetime | None = None) -> str:
     """Format a datetime as a smart relative string, e.g. "yesterday".
 
     Accepts both aware and naive datetimes: aware values are compared in UTC,
     naive values are assumed to be local time. Future timestamps clamp to
     "just now". Falls back to an absolute date once older than a year.
+
+    ``now`` lets a caller formatting many timestamps read the clock once; it
+    must be aware or naive to match ``dt``.
     """
     if dt is None:
         return ""
 
     if dt.tzinfo is not None:
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         dt = dt.astimezone(timezone.utc)
-    else:
+    elif now is None:
         now = datetime.now()
 
-    seconds = (now - dt).total_seconds()
+    # Whole seconds: every bucket boundary is an integer, so flooring first
+    # picks the same bucket and keeps the arithmetic in ints.
+    seconds = int((now - dt).total_seconds())
     if seconds < 0:
         seconds = 0
 
@@ -49,28 +55,23 @@ def humanize_relative(dt: datetime | None) -> str:
     if seconds < 90:
         return "a minute ago"
     if seconds < _HOUR:
-        n = int(seconds / _MINUTE)
-        return f"{n} minutes ago"
+        return f"{seconds // _MINUTE} minutes ago"
     if seconds < 90 * _MINUTE:
         return "an hour ago"
     if seconds < _DAY:
-        n = int(seconds / _HOUR)
-        return f"{n} hours ago"
+        return f"{seconds // _HOUR} hours ago"
     if seconds < 2 * _DAY:
         return "yesterday"
     if seconds < _WEEK:
-        n = int(seconds / _DAY)
-        return f"{n} days ago"
+        return f"{seconds // _DAY} days ago"
     if seconds < 2 * _WEEK:
         return "a week ago"
     if seconds < _MONTH:
-        n = int(seconds / _WEEK)
-        return f"{n} weeks ago"
+        return f"{seconds // _WEEK} weeks ago"
     if seconds < 2 * _MONTH:
         return "a month ago"
     if seconds < _YEAR:
-        n = int(seconds / _MONTH)
-        return f"{n} months ago"
+        return f"{seconds // _MONTH} months ago"
     if seconds < 2 * _YEAR:
         return "a year ago"
     return dt.strftime("%b %d, %Y")
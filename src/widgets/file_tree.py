@@ -1,7 +1,9 @@
 """File tree widget for browsing project files."""
 
 import os
+import re
 import subprocess
+import time
 from pathlib import Path
 
 import pathspec
@@ -11,6 +13,22 @@ from ..services import GitService, FileStatus, IconCache, ToastService, FileMoni
 from ..utils import git_auth
 
 
+# Named groups in pathspec's per-pattern regexes (e.g. "(?P<ps_d>/)"); they
+# repeat across patterns, so they're made anonymous before joining them
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+
+# Compiled .gitignore matchers by pattern tuple, shared by every FileTree (a
+# reopened project, worktrees of one repo): {patterns: (spec, runs)}
+_IGNORE_MATCHERS: dict[tuple[str, ...], tuple[pathspec.PathSpec, list | None]] = {}
+_IGNORE_MATCHERS_MAX = 16
+
+
+# One visible tree entry as produced by the walk: (path, rel_path, depth, is_dir),
+# where rel_path is relative to the root and is also the git status key
+TreeEntry = tuple[str, str, int, bool]
+
+
 # CSS classes for git status colors
 STATUS_CSS_CLASSES = {
     FileStatus.MODIFIED: "git-modified",
@@ -21,6 +39,31 @@ STATUS_CSS_CLASSES = {
     FileStatus.TYPECHANGE: "git-modified",
 }
 
+# Git status indicator (colored dot) appended to the name label as Pango markup,
+# colors matching STATUS_CSS_CLASSES
+_STATUS_COLORS = {
+    "git-modified": "#f1c40f",
+    "git-added": "#2ecc71",
+    "git-deleted": "#e74c3c",
+    "git-renamed": "#3498db",
+}
+STATUS_DOT_MARKUP = {
+    status: f'  <span foreground="{_STATUS_COLORS[css_class]}" size="x-small">●</span>'
+    for status, css_class in STATUS_CSS_CLASSES.items()
+}
+
+# Git status colors and selection, registered once per app by _setup_css()
+_FILE_TREE_CSS = "".join(
+    f".{css_class} {{ color: {color}; }}\n" for css_class, color in _STATUS_COLORS.items()
+).encode() + b"""
+.file-selected {
+    background-color: alpha(@accent_color, 0.3);
+}
+.file-selected:hover {
+    background-color: alpha(@accent_color, 0.4);
+}
+"""
+
 
 class FileTree(Gtk.Box):
     """A widget for browsing project files as a tree."""
@@ -38,10 +81,44 @@ class FileTree(Gtk.Box):
     # Files that should always be visible (even if in .gitignore)
     ALWAYS_VISIBLE = {".gitignore"}
 
+    # Both as one lookup for the walk: True = always hidden, False = always visible
+    _NAME_OVERRIDES = {
+        **dict.fromkeys(ALWAYS_VISIBLE, False),
+        **dict.fromkeys(ALWAYS_HIDDEN, True),
+    }
+
+    # Editor scratch files (backup~, vim .swp/.swx and its "4913" write probe)
+    # that churn on every save; their events don't warrant a tree refresh
+    EDITOR_TEMP_SUFFIXES = ("~", ".swp", ".swx")
+    EDITOR_TEMP_NAMES = {"4913"}
+
+    # After a refresh, further events within this window (ms) are coalesced
+    # into one trailing refresh at its end
+    REFRESH_COOLDOWN_MS = 300
+
+    # Max memoized ignore results before the memo is dropped and refilled
+    IGNORED_CACHE_MAX = 20000
+
+    # Row changes above which the list box is detached while they're applied
+    BULK_CHANGE_THRESHOLD = 200
+
+    # Rows inserted per main-loop iteration when filling a large block of
+    # new rows (first population, expanding a huge directory)
+    FILL_CHUNK = 200
+
+    # Directories modified this recently (ns) before a scan aren't cached: an
+    # entry added within the same mtime tick wouldn't invalidate the listing
+    LISTING_RACY_NS = 2_000_000_000
+
+    # Display-wide CSS, registered by the first FileTree and shared by the rest
+    _css_provider: Gtk.CssProvider | None = None
+
     def __init__(self, root_path: str, file_monitor_service: FileMonitorService):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
 
         self.root_path = Path(root_path)
+        self._root_str = str(self.root_path)
+        self._root_prefix = self._root_str + os.sep
         self._file_monitor_service = file_monitor_service
         self._expanded_paths: set[str] = set()
         self._git_status: dict[str, FileStatus] = {}
@@ -50,21 +127,51 @@ class FileTree(Gtk.Box):
         # File filtering (only .gitignore patterns)
         self._show_ignored = False
         self._ignore_spec: pathspec.PathSpec | None = None
+        self._ignore_re: re.Pattern | None = None
+        # With negated patterns: (regex, include) per run of same-sign patterns,
+        # last run first (see _compile_ignore_runs)
+        self._ignore_runs: list[tuple[re.Pattern, bool]] = []
+        # Memoized ignore results by relative path, one dict for files and one
+        # for directories (indexed by is_dir), so a hit needs no "/" suffix
+        # concatenation; reset whenever patterns change
+        self._ignored_cache: tuple[dict[str, bool], dict[str, bool]] = ({}, {})
+        self._gitignore_path = self.root_path / ".gitignore"
+        self._gitignore_str = os.fspath(self._gitignore_path)  # for event paths
+        # (mtime_ns, size) of the .gitignore the spec was built from; None = no file
+        self._ignore_fingerprint: tuple[int, int] | None = None
+        self._ignore_patterns: tuple[str, ...] = ()
+        # Filtered, sorted listing per scanned directory, reused while the
+        # directory's mtime is unchanged: {dir: (mtime_ns, check_ignored, survivors)}
+        self._listing_cache: dict[str, tuple[int, bool, list[tuple[bool, str, str, str]]]] = {}
+        # Bound per spec by _load_ignore_patterns() (no-op when nothing to match)
+        self._is_ignored = self._never_ignored
         self._load_ignore_patterns()
 
         # Initialize icon cache (singleton, loads icons once)
         self._icon_cache = IconCache()
 
         # Initialize git service
-        self._git_service = GitService(self.root_path)
+        self._git_service = GitService.get_or_create(self.root_path)
         self._is_git_repo = self._git_service.is_git_repo()
         if self._is_git_repo:
             self._git_service.open()
 
-        # Flag to skip redundant git status fetch after async load
-        self._git_status_fresh = False
-        # Debounce id for coalescing bursty working-tree refreshes (roadmap 2.9)
+        # Cooldown timer for coalescing bursty working-tree refreshes (roadmap 2.9)
         self._refresh_timeout_id = 0
+        # What the next scheduled refresh must cover: the whole tree, or only
+        # the listings of these (expanded) directories
+        self._tree_dirty = False
+        self._dirty_dirs: set[str] = set()
+        # The root .gitignore changed; re-read once by the next scheduled refresh
+        self._gitignore_dirty = False
+        # Set by monitor events that can change `git status` output; refreshes
+        # without one (expand_to_path, show-ignored toggle) reuse the cache
+        self._git_status_dirty = True
+
+        # FileMonitorService outlives the tree: its handlers are disconnected,
+        # and the cooldown timer removed, on destroy
+        self._monitor_handler_ids: list[int] = []
+        self.connect("destroy", self._on_destroy)
 
         self._build_ui()
         self._setup_css()
@@ -76,44 +183,165 @@ class FileTree(Gtk.Box):
         # Setup initial working tree monitors via service
         self._setup_initial_monitors()
 
-    def _load_ignore_patterns(self):
-        """Load ignore patterns from .gitignore only."""
-        patterns = []
+    def _load_ignore_patterns(self) -> bool:
+        """Load ignore patterns from .gitignore only.
 
-        # Load .gitignore if exists
-        gitignore_path = self.root_path / ".gitignore"
-        if gitignore_path.exists():
+        Skipped when the file's mtime and size match the ones the current spec
+        was built from, so unrelated events don't recompile the matcher.
+
+        Returns:
+            True if the effective pattern list changed
+        """
+        try:
+            st = self._gitignore_path.stat()
+            fingerprint = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fingerprint = None
+        if fingerprint == self._ignore_fingerprint:
+            return False
+        self._ignore_fingerprint = fingerprint
+
+        # Load .gitignore if exists, in one read (a stray non-UTF-8 byte is
+        # replaced rather than failing the whole file)
+        text = ""
+        if fingerprint is not None:
             try:
-                with open(gitignore_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip comments and empty lines
-                        if line and not line.startswith("#"):
-                            patterns.append(line)
+                text = self._gitignore_path.read_bytes().decode("utf-8", "replace")
             except OSError:
                 pass
+        # Skip comments and empty lines (pathspec would too, but the filtered
+        # list is also what's compared below)
+        patterns = [
+            line for line in map(str.strip, text.splitlines())
+            if line and not line.startswith("#")
+        ]
+
+        # Comment/whitespace-only edits leave the matcher as it is
+        if tuple(patterns) == self._ignore_patterns:
+            return False
+        self._ignore_patterns = tuple(patterns)
+        for cache in self._ignored_cache:
+            cache.clear()
+        self._listing_cache.clear()
 
-        # Create pathspec matcher (None if no patterns)
+        # Create pathspec matcher (None if no patterns) and pick the matching
+        # _is_ignored implementation, so the hot walk never branches on it
         if patterns:
-            self._ignore_spec = pathspec.PathSpec.from_lines(
+            self._ignore_spec, runs = self._get_ignore_matcher(self._ignore_patterns)
+            self._ignore_re = None
+            self._ignore_runs = []
+            if runs is None:
+                self._is_ignored = self._spec_is_ignored
+            elif not runs:
+                self._is_ignored = self._never_ignored
+            elif len(runs) == 1 and runs[0][1]:
+                self._ignore_re = runs[0][0]
+                self._is_ignored = self._regex_is_ignored
+            else:
+                self._ignore_runs = runs
+                self._is_ignored = self._runs_is_ignored
+        else:
+            self._ignore_spec = None
+            self._ignore_re = None
+            self._ignore_runs = []
+            self._is_ignored = self._never_ignored
+        return True
+
+    @classmethod
+    def _get_ignore_matcher(
+        cls, patterns: tuple[str, ...]
+    ) -> tuple[pathspec.PathSpec, list[tuple[re.Pattern, bool]] | None]:
+        """Compile (or reuse) the pathspec and regex runs for a pattern list."""
+        matcher = _IGNORE_MATCHERS.get(patterns)
+        if matcher is None:
+            spec = pathspec.PathSpec.from_lines(
                 pathspec.patterns.GitWildMatchPattern,
                 patterns
             )
-        else:
-            self._ignore_spec = None
-
-    def _is_ignored(self, path: Path) -> bool:
-        """Check if a path should be ignored."""
-        if self._ignore_spec is None:
-            return False
+            matcher = (spec, cls._compile_ignore_runs(spec))
+            if len(_IGNORE_MATCHERS) >= _IGNORE_MATCHERS_MAX:
+                _IGNORE_MATCHERS.clear()
+            _IGNORE_MATCHERS[patterns] = matcher
+        return matcher
 
+    @staticmethod
+    def _compile_ignore_runs(spec: pathspec.PathSpec) -> list[tuple[re.Pattern, bool]] | None:
+        """Join a spec's patterns into one alternation regex per same-sign run.
+
+        PathSpec.match_file() tries every pattern's regex in Python and keeps
+        the last match's sign. Consecutive patterns of the same sign ("build/",
+        "*.pyc" vs "!keep.pyc") can't override each other, so each run becomes
+        one compiled alternation; checked last run first, the first run that
+        matches decides. Without negated patterns that's a single C-level match.
+
+        Returns:
+            (regex, include) per run, last run first; None if a regex fails
+            to compile (the caller keeps using pathspec)
+        """
+        runs: list[tuple[list[str], bool]] = []
+        for pattern in spec.patterns:
+            if pattern.include is None:
+                continue
+            regex = f"(?:{_NAMED_GROUP_RE.sub('(?:', pattern.regex.pattern)})"
+            if runs and runs[-1][1] == pattern.include:
+                runs[-1][0].append(regex)
+            else:
+                runs.append(([regex], pattern.include))
         try:
-            relative = path.relative_to(self.root_path)
+            return [(re.compile("|".join(parts)), include) for parts, include in reversed(runs)]
+        except re.error:
+            return None
+
+    @staticmethod
+    def _never_ignored(rel_path: str, is_dir: bool) -> bool:
+        """`_is_ignored` when there are no ignore patterns."""
+        return False
+
+    def _regex_is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """`_is_ignored` when the patterns compiled into one regex."""
+        cache = self._ignored_cache[is_dir]
+        ignored = cache.get(rel_path)
+        if ignored is None:
+            match_path = rel_path + "/" if is_dir else rel_path
+            ignored = self._ignore_re.match(match_path) is not None
+            self._remember_ignored(cache, rel_path, ignored)
+        return ignored
+
+    def _runs_is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """`_is_ignored` when negated patterns split the regex into runs."""
+        cache = self._ignored_cache[is_dir]
+        ignored = cache.get(rel_path)
+        if ignored is None:
+            match_path = rel_path + "/" if is_dir else rel_path
+            ignored = False
+            for regex, include in self._ignore_runs:
+                if regex.match(match_path) is not None:
+                    ignored = include
+                    break
+            self._remember_ignored(cache, rel_path, ignored)
+        return ignored
+
+    def _spec_is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """`_is_ignored` fallback when the patterns don't compile into runs.
+
+        Args:
+            rel_path: Path relative to the project root
+            is_dir: Whether it's a directory (the caller already knows, no stat)
+        """
+        cache = self._ignored_cache[is_dir]
+        ignored = cache.get(rel_path)
+        if ignored is None:
             # Add trailing slash for directories to match directory patterns
-            match_path = str(relative) + "/" if path.is_dir() else str(relative)
-            return self._ignore_spec.match_file(match_path)
-        except ValueError:
-            return False
+            match_path = rel_path + "/" if is_dir else rel_path
+            ignored = self._ignore_spec.match_file(match_path)
+            self._remember_ignored(cache, rel_path, ignored)
+        return ignored
+
+    def _remember_ignored(self, cache: dict[str, bool], rel_path: str, ignored: bool):
+        """Memoize an ignore result; every refresh re-checks the same paths."""
+        if len(cache) >= self.IGNORED_CACHE_MAX:
+            cache.clear()
+        cache[rel_path] = ignored
 
     @property
     def show_ignored(self) -> bool:
@@ -126,6 +354,7 @@ class FileTree(Gtk.Box):
         if self._show_ignored != value:
             self._show_ignored = value
             self.refresh()
+            self._update_monitors()
 
     def _build_ui(self):
         """Build the file tree UI."""
@@ -144,6 +373,19 @@ class FileTree(Gtk.Box):
         self._selected_rows: set[Gtk.ListBoxRow] = set()
         self._last_clicked_row: Gtk.ListBoxRow | None = None
 
+        # Rows currently in the list box, in display order (mirrors list_box)
+        self._rows: list[Gtk.ListBoxRow] = []
+
+        # Detached rows kept for reuse, so a refresh rebinds widgets instead
+        # of allocating (and styling) a fresh widget tree per entry
+        self._row_pool: list[Gtk.ListBoxRow] = []
+
+        # Block of new rows still being inserted on idle (see _fill_rows)
+        self._fill_entries: list[TreeEntry] = []
+        self._fill_pos = 0
+        self._fill_index = 0
+        self._fill_source_id = 0
+
         # Left-click for selection (with Ctrl/Shift support)
         left_click = Gtk.GestureClick()
         left_click.set_button(1)  # Left click
@@ -168,30 +410,17 @@ class FileTree(Gtk.Box):
         self._create_context_menu()
 
     def _setup_css(self):
-        """Set up CSS for git status colors and selection."""
-        css = b"""
-        .git-modified { color: #f1c40f; }
-        .git-added { color: #2ecc71; }
-        .git-deleted { color: #e74c3c; }
-        .git-renamed { color: #3498db; }
-        .git-indicator {
-            font-size: 8px;
-            margin-left: 4px;
-        }
-        .file-selected {
-            background-color: alpha(@accent_color, 0.3);
-        }
-        .file-selected:hover {
-            background-color: alpha(@accent_color, 0.4);
-        }
-        """
+        """Set up CSS for git status colors and selection (once per app)."""
+        if FileTree._css_provider is not None:
+            return
         provider = Gtk.CssProvider()
-        provider.load_from_data(css)
+        provider.load_from_data(_FILE_TREE_CSS)
         Gtk.StyleContext.add_provider_for_display(
             self.get_display(),
             provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        FileTree._css_provider = provider
 
     def _create_context_menu(self):
         """Create the right-click context menu."""
@@ -239,7 +468,7 @@ class FileTree(Gtk.Box):
     def _on_left_click(self, gesture, n_press, x, y):
         """Handle left-click for selection with Ctrl/Shift support."""
         row = self.list_box.get_row_at_y(int(y))
-        if not row or not hasattr(row, "path"):
+        if not row or not hasattr(row, "path_str"):
             return
 
         # Get modifier state
@@ -269,7 +498,7 @@ class FileTree(Gtk.Box):
     def _on_right_click(self, gesture, n_press, x, y):
         """Handle right-click to show context menu."""
         row = self.list_box.get_row_at_y(int(y))
-        if row and hasattr(row, "path"):
+        if row and hasattr(row, "path_str"):
             # Add to selection if not already selected
             if row not in self._selected_rows:
                 self._select_row(row)
@@ -323,13 +552,8 @@ class FileTree(Gtk.Box):
 
     def _select_all(self):
         """Select all visible rows."""
-        i = 0
-        while True:
-            row = self.list_box.get_row_at_index(i)
-            if row is None:
-                break
+        for row in self._rows:
             self._select_row(row)
-            i += 1
         self.emit("selection-changed", len(self._selected_rows) > 0)
 
     def _on_key_pressed(self, controller, keyval, keycode, state):
@@ -366,8 +590,8 @@ class FileTree(Gtk.Box):
         """Get list of selected paths."""
         paths = []
         for row in self._selected_rows:
-            if hasattr(row, "path"):
-                paths.append(row.path)
+            if hasattr(row, "path_str"):
+                paths.append(Path(row.path_str))
         return paths
 
     def _on_copy_path(self, action, param):
@@ -380,14 +604,15 @@ class FileTree(Gtk.Box):
 
     def _copy_selected_paths(self, relative: bool):
         """Copy selected paths to clipboard."""
-        paths = self.get_selected_paths()
-        if not paths:
+        rows = self._selected_rows
+        if not rows:
             return
 
+        # Rows carry both forms already (rel_path is sliced once by the walk)
         if relative:
-            text = "\n".join(self._get_relative_path(p) for p in paths)
+            text = "\n".join(row.rel_path for row in rows)
         else:
-            text = "\n".join(str(p) for p in paths)
+            text = "\n".join(row.path_str for row in rows)
 
         clipboard = Gdk.Display.get_default().get_clipboard()
         clipboard.set(text)
@@ -482,23 +707,27 @@ class FileTree(Gtk.Box):
             self._git_status = {}
 
         # Build tree from root using whatever git status we currently have
-        self._add_directory_contents(self.root_path, 0)
+        entries: list[TreeEntry] = []
+        self._add_directory_contents(self._root_str, 0, entries)
+        self._sync_rows(entries)
 
         # Always load git status async (subprocess avoids pygit2 GIL blocking)
-        if self._is_git_repo and not self._git_status_fresh:
+        if self._is_git_repo:
             self._load_git_status_async()
-        elif self._git_status_fresh:
-            self._git_status_fresh = False
+            self._git_status_dirty = False
 
     def _load_git_status_async(self):
         """Load git status off-thread (generation-guarded, one in-flight at a time)."""
-        root = str(self.root_path)
+        root = self._root_str
         env = git_auth.build_git_env()
 
         def _fetch():
             try:
+                # No optional locks: a background status must not rewrite
+                # .git/index, whose monitor would report it as a status change
+                # and trigger another refresh + status round-trip
                 result = subprocess.run(
-                    ["git", "status", "--porcelain", "-z"],
+                    ["git", "--no-optional-locks", "status", "--porcelain", "-z"],
                     capture_output=True, cwd=root, timeout=30, env=env,
                 )
                 return self._parse_porcelain_status(result.stdout)
@@ -532,7 +761,9 @@ class FileTree(Gtk.Box):
 
             index_code = chr(entry[0])
             wt_code = chr(entry[1])
-            path = entry[3:].decode("utf-8", errors="replace")
+            # Keys must equal the rows' rel_path: "/"-separated, relative to
+            # the root, and without the trailing "/" git gives untracked dirs
+            path = entry[3:].decode("utf-8", errors="replace").rstrip("/")
 
             # Working tree status takes priority (more urgent)
             if wt_code in status_map:
@@ -549,232 +780,506 @@ class FileTree(Gtk.Box):
         return result
 
     def _apply_git_status(self, status):
-        """Apply loaded git status and refresh tree."""
-        self._git_status = status
-        self._git_status_fresh = True
-        self.refresh()
+        """Apply loaded git status by restyling the existing rows in place."""
+        old = self._git_status
+        if status != old:
+            self._git_status = status
+            # A mostly clean tree has few statused paths; only rows whose key
+            # appears on either side can have changed
+            changed = {
+                path for path in old.keys() | status.keys()
+                if old.get(path) != status.get(path)
+            }
+            for row in self._rows:
+                if row.rel_path in changed:
+                    self._apply_row_status(row)
         return False
 
     def refresh(self):
-        """Refresh the file tree."""
-        # Save scroll position
-        vadj = self.scrolled.get_vadjustment()
-        scroll_pos = vadj.get_value()
+        """Refresh the file tree, touching only the rows that changed."""
+        # Walk the tree from root (using current cached git status)
+        entries: list[TreeEntry] = []
+        self._add_directory_contents(self._root_str, 0, entries)
+        self._sync_rows(entries)
+        self._reload_git_status_if_dirty()
+
+    def _refresh_directory(self, directory: str):
+        """Re-walk one expanded directory and sync only its rows.
+
+        Used for working-tree events, which only change the listing of the
+        directory they happened in; rows outside its subtree aren't touched.
+        """
+        if directory not in self._expanded_paths:
+            return  # Collapsed: its contents aren't shown
+        self._finish_fill()  # row indices below must be final
+        index = next(
+            (i for i, row in enumerate(self._rows) if row.path_str == directory), None
+        )
+        if index is None:
+            return  # Inside a collapsed or hidden directory
+        row = self._rows[index]
+        entries: list[TreeEntry] = []
+        self._add_directory_contents(directory, row.depth + 1, entries, row.rel_path + "/")
+        start = index + 1
+        self._sync_rows(entries, start, self._subtree_end(start, directory))
+
+    def _reload_git_status_if_dirty(self):
+        """Refresh git status asynchronously (subprocess, no GIL blocking), but
+        only if an event since the last load could have changed it."""
+        if self._is_git_repo and self._git_status_dirty:
+            self._load_git_status_async()
+            self._git_status_dirty = False
 
-        # Save selected paths for restoration
-        selected_paths: set[str] = set()
-        for row in self._selected_rows:
-            if hasattr(row, "path"):
-                selected_paths.add(str(row.path))
+    def _sync_rows(self, entries: list[TreeEntry], start: int = 0, end: int | None = None):
+        """Diff walked entries against the displayed rows and apply the delta.
 
-        # Recreate list box to avoid GTK remove warnings
-        if self.context_menu:
-            self.context_menu.unparent()
+        Rows whose entry is gone are detached into the pool and rows for new
+        entries are inserted at their position. Surviving rows keep their
+        widgets, selection and scroll position; only their expander is
+        updated. The list box, its controllers and the context menu
+        are never rebuilt.
 
-        self.list_box = Gtk.ListBox()
-        self.list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.list_box.add_css_class("navigation-sidebar")
-        self.list_box.connect("row-activated", self._on_row_activated)
+        Args:
+            entries: Walked entries, in display order
+            start: Index of the first displayed row the entries replace
+            end: Index after the last one (None = through the last row)
+        """
+        self._finish_fill()
+        if end is None:
+            end = len(self._rows)
+        if not self._rows:
+            # Nothing to diff against (first population)
+            self._fill_rows(entries, 0)
+            return
+        wanted = {path_str: is_dir for path_str, _rel, _depth, is_dir in entries}
+        selected_before = len(self._selected_rows)
+
+        rows_by_path: dict[str, Gtk.ListBoxRow] = {}
+        stale: list[Gtk.ListBoxRow] = []
+        for row in self._rows[start:end]:
+            if wanted.get(row.path_str) == row.is_dir:
+                rows_by_path[row.path_str] = row
+            else:
+                stale.append(row)
 
-        # Clear selection tracking (will restore after building tree)
-        self._selected_rows = set()
-        self._last_clicked_row = None
+        # Large batches (first population, toggling ignored files) are applied
+        # with the list box out of the widget tree, so GTK doesn't restyle and
+        # re-measure it once per inserted row
+        changes = len(stale) + len(entries) - len(rows_by_path)
+        detached = self._detach_list_box_for(changes)
 
-        # Left-click for selection
-        left_click = Gtk.GestureClick()
-        left_click.set_button(1)
-        left_click.connect("pressed", self._on_left_click)
-        self.list_box.add_controller(left_click)
+        if stale and not rows_by_path and len(stale) == len(self._rows):
+            # Nothing survives (root swapped, tree emptied): clear in one pass
+            self._clear_selection()
+            self._last_clicked_row = None
+            self.list_box.remove_all()
+            self._row_pool.extend(stale)
+        else:
+            for row in stale:
+                self._detach_row(row)
+
+        # Survivors keep their relative order, so inserting each new row at
+        # its final index leaves everything before it already in place
+        rows: list[Gtk.ListBoxRow] = []
+        expanded = self._expanded_paths
+        for index, (path_str, rel_path, depth, is_dir) in enumerate(entries, start):
+            row = rows_by_path.get(path_str)
+            if row is None:
+                row = self._create_row(path_str, rel_path, depth, is_dir)
+                self.list_box.insert(row, index)
+            else:
+                # (git status is kept current by _apply_git_status)
+                if is_dir and row.is_expanded != (path_str in expanded):
+                    self._update_row_expander(row, not row.is_expanded)
+            rows.append(row)
+        self._rows[start:end] = rows
+        self._reattach_list_box(detached)
 
-        # Right-click context menu
-        right_click = Gtk.GestureClick()
-        right_click.set_button(3)
-        right_click.connect("pressed", self._on_right_click)
-        self.list_box.add_controller(right_click)
+        if len(self._selected_rows) != selected_before:
+            self.emit("selection-changed", len(self._selected_rows) > 0)
 
-        # Keyboard shortcuts
-        key_controller = Gtk.EventControllerKey()
-        key_controller.connect("key-pressed", self._on_key_pressed)
-        self.list_box.add_controller(key_controller)
+    def _detach_list_box_for(self, changes: int) -> float | None:
+        """Take the list box out of the widget tree if `changes` is a bulk batch.
 
-        # Replace in scrolled window
+        Returns the scroll position to restore via `_reattach_list_box`, or
+        None if the batch is small enough to apply in place.
+        """
+        if changes <= self.BULK_CHANGE_THRESHOLD:
+            return None
+        scroll_pos = self.scrolled.get_vadjustment().get_value()
+        self.scrolled.set_child(None)
+        return scroll_pos
+
+    def _reattach_list_box(self, scroll_pos: float | None):
+        """Undo `_detach_list_box_for`, restoring the scroll position on idle."""
+        if scroll_pos is None:
+            return
         self.scrolled.set_child(self.list_box)
-
-        # Recreate context menu with new parent
-        self._create_context_menu()
-
-        # Build tree from root (using current cached git status)
-        self._add_directory_contents(self.root_path, 0)
-
-        # Refresh git status asynchronously (subprocess, no GIL blocking)
-        if self._is_git_repo and not self._git_status_fresh:
-            self._load_git_status_async()
-        elif self._git_status_fresh:
-            self._git_status_fresh = False
-
-        # Restore selection and scroll position after UI updates
-        def restore_state():
-            # Restore selection
-            if selected_paths:
-                i = 0
-                while True:
-                    row = self.list_box.get_row_at_index(i)
-                    if row is None:
-                        break
-                    if hasattr(row, "path") and str(row.path) in selected_paths:
-                        self._select_row(row)
-                    i += 1
-            # Restore scroll
-            vadj.set_value(scroll_pos)
-            return False
-
-        GLib.idle_add(restore_state)
-
-    def _add_directory_contents(self, directory: Path, depth: int):
-        """Add contents of a directory to the tree."""
-        try:
-            entries = sorted(
-                directory.iterdir(),
-                key=lambda p: (not p.is_dir(), p.name.lower())
-            )
-        except PermissionError:
+        vadj = self.scrolled.get_vadjustment()
+        GLib.idle_add(lambda: vadj.set_value(scroll_pos) or False)
+
+    def _add_directory_contents(
+        self,
+        directory: str,
+        depth: int,
+        entries: list[TreeEntry],
+        rel_prefix: str = "",
+    ):
+        """Append a `TreeEntry` for each of a directory's visible contents.
+
+        Contents of expanded subdirectories follow their parent, so `entries`
+        ends up in display order. `rel_prefix` is the directory's path relative
+        to the root (with a trailing "/"), threaded down so ignore checks can
+        concatenate instead of re-deriving it per entry.
+        """
+        survivors = self._scan_directory(directory, rel_prefix)
+        if not survivors:
             return
 
-        for entry in entries:
-            # Always skip .git folder
-            if entry.name in self.ALWAYS_HIDDEN:
-                continue
+        # Depth-first with an explicit stack of listing iterators instead of
+        # recursion: an expanded directory's listing is pushed and walked
+        # first, then its parent's iterator resumes right after it
+        expanded = self._expanded_paths
+        scan = self._scan_directory
+        stack = [(iter(survivors), depth)]
+        while stack:
+            listing, level = stack[-1]
+            for is_file, _name_lower, rel_path, path_str in listing:
+                entries.append((path_str, rel_path, level, not is_file))
+
+                # If directory is expanded, add its contents
+                if not is_file and path_str in expanded:
+                    children = scan(path_str, rel_path + "/")
+                    if children:
+                        stack.append((iter(children), level + 1))
+                        break
+            else:
+                stack.pop()
 
-            # Always show certain files (like .gitignore)
-            if entry.name in self.ALWAYS_VISIBLE:
-                pass  # Don't skip
-            # Skip ignored files (from .gitignore) unless show_ignored is True
-            elif not self._show_ignored and self._is_ignored(entry):
-                continue
+    def _scan_directory(
+        self, directory: str, rel_prefix: str
+    ) -> list[tuple[bool, str, str, str]] | None:
+        """List a directory's visible contents as sorted (is_file, lower, rel, path).
 
-            row = self._create_row(entry, depth)
-            self.list_box.append(row)
+        The listing is reused while the directory's mtime is unchanged (adding,
+        removing or renaming an entry bumps it), so a refresh only re-enumerates
+        directories that changed; edits to file contents don't.
 
-            # If directory is expanded, add its contents
-            if entry.is_dir() and str(entry) in self._expanded_paths:
-                self._add_directory_contents(entry, depth + 1)
+        Returns:
+            The listing, or None if the directory can't be read
+        """
+        check_ignored = not self._show_ignored
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._listing_cache.pop(directory, None)
+            return None
+        cached = self._listing_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == check_ignored:
+            return cached[2]
+        scan_start = time.time_ns()
+
+        # Filter while scanning (cheapest checks first) and only sort what
+        # survives, so huge ignored trees never reach the sort or recursion.
+        # scandir reports the entry type from readdir: no stat per entry
+        # (only symlinks are resolved).
+        name_override = self._NAME_OVERRIDES.get
+        is_ignored = self._is_ignored
+        survivors: list[tuple[bool, str, str, str]] = []  # (is_file, lower, rel, path)
+        try:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    # Always skip .git folder
+                    forced = name_override(name)
+                    if forced:
+                        continue
+                    is_dir = dir_entry.is_dir()
+                    rel_path = rel_prefix + name
+                    # Skip ignored files (from .gitignore) unless show_ignored is
+                    # True; always show certain files (like .gitignore)
+                    if check_ignored and forced is None and is_ignored(rel_path, is_dir):
+                        continue
+                    # Dirs first, then case-insensitive name
+                    survivors.append((not is_dir, name.lower(), rel_path, dir_entry.path))
+        except OSError:
+            return None
+        # The tuples are their own sort key (dirs first, then case-insensitive
+        # name; names differing only in case fall back to the exact name), so
+        # no per-entry key tuples are built
+        survivors.sort()
+
+        if scan_start - mtime_ns > self.LISTING_RACY_NS:
+            self._listing_cache[directory] = (mtime_ns, check_ignored, survivors)
+        else:
+            self._listing_cache.pop(directory, None)
+        return survivors
+
+    def _create_row(
+        self, path_str: str, rel_path: str, depth: int, is_dir: bool
+    ) -> Gtk.ListBoxRow:
+        """Get a row for a file or directory, recycling a pooled one if available."""
+        row = self._row_pool.pop() if self._row_pool else self._new_row()
+        self._bind_row(row, path_str, rel_path, depth, is_dir)
+        return row
 
-    def _create_row(self, path: Path, depth: int) -> Gtk.ListBoxRow:
-        """Create a row for a file or directory."""
+    def _new_row(self) -> Gtk.ListBoxRow:
+        """Build an empty row skeleton: expander, icon, name and git indicator."""
         row = Gtk.ListBoxRow()
-        row.path = path
-        row.is_dir = path.is_dir()
 
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        box.set_margin_start(12 + depth * 16)
         box.set_margin_end(12)
         box.set_margin_top(4)
         box.set_margin_bottom(4)
 
-        # Expand indicator for directories
-        if path.is_dir():
-            is_expanded = str(path) in self._expanded_paths
-            expander_icon = "pan-down-symbolic" if is_expanded else "pan-end-symbolic"
-            expander = Gtk.Image.new_from_icon_name(expander_icon)
-            expander.add_css_class("dim-label")
-            box.append(expander)
-            row.expander = expander
-        else:
-            # Spacer for alignment
-            spacer = Gtk.Box()
-            spacer.set_size_request(16, -1)
-            box.append(spacer)
+        # Expand indicator for directories (blank 16px spacer for files)
+        expander = Gtk.Image()
+        expander.set_size_request(16, -1)
+        expander.add_css_class("dim-label")
+        box.append(expander)
 
         # Icon (from cached Material Design icons, using GIcon for crisp rendering)
-        is_expanded = str(path) in self._expanded_paths if path.is_dir() else False
-        gicon = self._icon_cache.get_gicon(path, is_open=is_expanded)
-
-        if gicon:
-            icon = Gtk.Image.new_from_gicon(gicon)
-            icon.set_pixel_size(16)
-        else:
-            # Fallback to system icon
-            icon_name = "folder-symbolic" if path.is_dir() else "text-x-generic-symbolic"
-            icon = Gtk.Image.new_from_icon_name(icon_name)
+        icon = Gtk.Image()
+        icon.set_pixel_size(16)
         box.append(icon)
 
         # Name
-        label = Gtk.Label(label=path.name)
+        label = Gtk.Label()
         label.set_xalign(0)
         label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
         label.set_hexpand(True)
-
-        # Apply git status color to label
-        relative_path = self._get_relative_path(path)
-        git_status = self._git_status.get(relative_path)
-        if git_status:
-            css_class = STATUS_CSS_CLASSES.get(git_status)
-            if css_class:
-                label.add_css_class(css_class)
-
         box.append(label)
 
-        # Git status indicator (colored dot)
-        if git_status:
-            indicator = Gtk.Label(label="●")
-            indicator.add_css_class("git-indicator")
-            css_class = STATUS_CSS_CLASSES.get(git_status)
-            if css_class:
-                indicator.add_css_class(css_class)
-            box.append(indicator)
-
         row.set_child(box)
+        row.box = box
+        row.expander = expander
+        row.icon = icon
+        row.label = label
+        row.git_status = None  # status the label is styled for
+        row.gicon = None  # icon currently set on row.icon
         return row
 
-    def _get_relative_path(self, path: Path) -> str:
-        """Get path relative to repository root."""
-        try:
-            return str(path.relative_to(self.root_path))
-        except ValueError:
-            return str(path)
+    def _bind_row(
+        self, row: Gtk.ListBoxRow, path_str: str, rel_path: str, depth: int, is_dir: bool
+    ):
+        """Fill a (new or recycled) row skeleton for a file or directory."""
+        name = os.path.basename(path_str)
+        row.path_str = path_str
+        row.name = name
+        row.rel_path = rel_path
+        row.is_dir = is_dir
+        row.depth = depth
+        row.box.set_margin_start(12 + depth * 16)
+
+        is_expanded = is_dir and path_str in self._expanded_paths
+        row.is_expanded = is_expanded
+        if is_dir:
+            expander_icon = "pan-down-symbolic" if is_expanded else "pan-end-symbolic"
+            row.expander.set_from_icon_name(expander_icon)
+        else:
+            row.expander.clear()
+
+        self._set_row_icon(row, self._icon_cache.get_gicon_for_name(name, is_dir, is_expanded))
+
+        if not self._apply_row_status(row):
+            self._render_row_label(row)
+
+    def _set_row_icon(self, row: Gtk.ListBoxRow, gicon: Gio.Icon | None):
+        """Point a row's icon at a cached GIcon, unless it already shows it.
+
+        Setting an image (even to the same icon) clears it and re-resolves the
+        texture on the next draw, so recycled rows of the same type skip that.
+        """
+        if gicon is not None and gicon is row.gicon:
+            return
+        row.gicon = gicon
+        if gicon:
+            row.icon.set_from_gicon(gicon)
+        else:
+            # Fallback to system icon
+            row.icon.set_from_icon_name(
+                "folder-symbolic" if row.is_dir else "text-x-generic-symbolic"
+            )
+
+    def _apply_row_status(self, row: Gtk.ListBoxRow) -> bool:
+        """Apply git status color and indicator to a row's label (if changed).
+
+        Returns:
+            True if the label was restyled
+        """
+        git_status = self._git_status.get(row.rel_path)
+        if git_status == row.git_status:
+            return False
+        row.git_status = git_status
+        css_class = STATUS_CSS_CLASSES.get(git_status) if git_status else None
+        row.label.set_css_classes([css_class] if css_class else [])
+        self._render_row_label(row)
+        return True
+
+    @staticmethod
+    def _render_row_label(row: Gtk.ListBoxRow):
+        """Set a row's name, with the git indicator dot if it has a status."""
+        dot = STATUS_DOT_MARKUP.get(row.git_status) if row.git_status else None
+        if dot:
+            row.label.set_markup(GLib.markup_escape_text(row.name) + dot)
+        else:
+            row.label.set_label(row.name)
+
+    def _detach_row(self, row: Gtk.ListBoxRow):
+        """Remove a row from the list box (and selection) into the pool for reuse."""
+        self._deselect_row(row)
+        if row is self._last_clicked_row:
+            self._last_clicked_row = None
+        self.list_box.remove(row)
+        self._row_pool.append(row)
 
     def _on_row_activated(self, list_box, row):
         """Handle row activation."""
-        if not hasattr(row, "path"):
+        if not hasattr(row, "path_str"):
             return
 
-        path = row.path
+        path_str = row.path_str
 
         if row.is_dir:
             # Toggle expansion
-            path_str = str(path)
             if path_str in self._expanded_paths:
                 self._expanded_paths.discard(path_str)
-                # Remove monitor when collapsing
-                self._file_monitor_service.remove_working_tree_monitor(path)
+                self._collapse_row(row)
             else:
                 self._expanded_paths.add(path_str)
-                # Add monitor when expanding
-                self._file_monitor_service.add_working_tree_monitor(path)
-            self.refresh()
+                self._expand_row(row)
+            # Watch exactly the directories now on display (expanded
+            # subdirectories come and go with their parent)
+            self._update_monitors()
         else:
             # Emit file activated signal
-            self.emit("file-activated", str(path))
+            self.emit("file-activated", path_str)
+
+    def _expand_row(self, row: Gtk.ListBoxRow):
+        """Insert a directory's children directly below its row (no full rebuild)."""
+        entries: list[TreeEntry] = []
+        self._add_directory_contents(
+            row.path_str, row.depth + 1, entries,
+            row.rel_path + "/",
+        )
+        self._finish_fill()
+        self._fill_rows(entries, row.get_index() + 1)
+        self._update_row_expander(row, True)
+
+    def _collapse_row(self, row: Gtk.ListBoxRow):
+        """Remove the contiguous descendant rows below a directory row."""
+        self._finish_fill()
+        start = row.get_index() + 1
+        end = self._subtree_end(start, row.path_str)
+        selected_before = len(self._selected_rows)
+        detached = self._detach_list_box_for(end - start)
+        for child in self._rows[start:end]:
+            self._detach_row(child)
+        del self._rows[start:end]
+        self._reattach_list_box(detached)
+        self._update_row_expander(row, False)
+        if len(self._selected_rows) != selected_before:
+            self.emit("selection-changed", len(self._selected_rows) > 0)
+
+    def _fill_rows(self, entries: list[TreeEntry], index: int):
+        """Insert new rows for `entries` as one contiguous block at `index`.
+
+        The first FILL_CHUNK rows go in right away; the rest are added
+        FILL_CHUNK per idle iteration, so expanding node_modules or a first
+        population of a huge tree doesn't freeze the window. Anything that
+        changes the row structure calls `_finish_fill()` first.
+        """
+        self._fill_entries = entries
+        self._fill_pos = 0
+        self._fill_index = index
+        if self._fill_step():
+            self._fill_source_id = GLib.idle_add(self._on_fill_idle)
+
+    def _fill_step(self) -> bool:
+        """Insert the next chunk of the pending block; True if more remain."""
+        pos = self._fill_pos
+        chunk = self._fill_entries[pos:pos + self.FILL_CHUNK]
+        index = self._fill_index
+        rows = [self._create_row(*entry) for entry in chunk]
+        for i, row in enumerate(rows):
+            self.list_box.insert(row, index + i)
+        self._rows[index:index] = rows
+        self._fill_pos = pos + len(chunk)
+        self._fill_index = index + len(chunk)
+        if self._fill_pos < len(self._fill_entries):
+            return True
+        self._fill_entries = []
+        return False
+
+    def _on_fill_idle(self) -> bool:
+        if self._fill_step():
+            return True
+        self._fill_source_id = 0
+        return False
+
+    def _finish_fill(self):
+        """Insert whatever is left of a pending block right now."""
+        if not self._fill_source_id:
+            return
+        GLib.source_remove(self._fill_source_id)
+        self._fill_source_id = 0
+        while self._fill_step():
+            pass
+
+    def _subtree_end(self, start: int, directory: str) -> int:
+        """Index after the contiguous rows from `start` that are inside `directory`."""
+        prefix = directory + os.sep
+        rows = self._rows
+        end = start
+        while end < len(rows) and rows[end].path_str.startswith(prefix):
+            end += 1
+        return end
+
+    def _update_row_expander(self, row: Gtk.ListBoxRow, is_expanded: bool):
+        """Swap a directory row's expander arrow and folder icon in place."""
+        row.is_expanded = is_expanded
+        expander_icon = "pan-down-symbolic" if is_expanded else "pan-end-symbolic"
+        row.expander.set_from_icon_name(expander_icon)
+        gicon = self._icon_cache.get_gicon_for_name(
+            os.path.basename(row.path_str), True, is_expanded
+        )
+        if gicon:
+            self._set_row_icon(row, gicon)
 
     def expand_to_path(self, file_path: str):
         """Expand tree to show a specific file."""
-        path = Path(file_path)
-        try:
-            relative = path.relative_to(self.root_path)
-            current = self.root_path
-            for part in relative.parts[:-1]:
-                current = current / part
-                self._expanded_paths.add(str(current))
+        file_path = os.path.normpath(file_path)
+        if not file_path.startswith(self._root_prefix):
+            return  # Path not under root
+        current = self._root_str
+        newly_expanded = False
+        for part in file_path[len(self._root_prefix):].split(os.sep)[:-1]:
+            current = current + os.sep + part
+            if current not in self._expanded_paths:
+                self._expanded_paths.add(current)
+                newly_expanded = True
+        # Already on display: nothing to walk
+        if newly_expanded:
             self.refresh()
-        except ValueError:
-            pass  # Path not under root
+            self._update_monitors()
 
     # --- File System Monitoring via FileMonitorService ---
 
     def _connect_monitor_signals(self):
         """Connect to FileMonitorService signals."""
-        self._file_monitor_service.connect("git-status-changed", self._on_git_status_changed)
-        self._file_monitor_service.connect("working-tree-changed", self._on_working_tree_changed)
+        self._monitor_handler_ids = [
+            self._file_monitor_service.connect("git-status-changed", self._on_git_status_changed),
+            self._file_monitor_service.connect("working-tree-changed", self._on_working_tree_changed),
+        ]
+
+    def _on_destroy(self, widget):
+        """Drop monitor handlers and the cooldown timer (safe to run twice)."""
+        handler_ids, self._monitor_handler_ids = self._monitor_handler_ids, []
+        for handler_id in handler_ids:
+            self._file_monitor_service.disconnect(handler_id)
+        if self._refresh_timeout_id:
+            GLib.source_remove(self._refresh_timeout_id)
+            self._refresh_timeout_id = 0
 
     def _setup_initial_monitors(self):
         """Setup initial working tree monitors via service."""
@@ -786,17 +1291,30 @@ class FileTree(Gtk.Box):
             self._file_monitor_service.add_working_tree_monitor(Path(path_str))
 
     def _update_monitors(self):
-        """Update monitors to match currently expanded directories."""
-        # Prune expanded paths that vanished externally, so their monitors are
-        # dropped below instead of dangling forever.
+        """Update monitors to match the expanded directories on display."""
+        # Directories that should be monitored: only those whose contents are
+        # shown. Expanded directories inside a collapsed one, or inside an
+        # ignored one while ignored files are hidden, stay remembered but
+        # unwatched (a node_modules expanded once shouldn't fan out events).
+        should_monitor = {self._root_str}
+        for row in self._rows:
+            if row.is_expanded:
+                should_monitor.add(row.path_str)
+        # ...including those whose rows are still being filled in
+        for path_str, _rel, _depth, is_dir in self._fill_entries[self._fill_pos:]:
+            if is_dir and path_str in self._expanded_paths:
+                should_monitor.add(path_str)
+
+        # Prune expanded paths that vanished externally, so they don't linger
+        # forever. The walk just listed the displayed ones, so only the
+        # remembered-but-hidden ones need a stat.
         self._expanded_paths = {
-            p for p in self._expanded_paths if os.path.isdir(p)
+            p for p in self._expanded_paths if p in should_monitor or os.path.isdir(p)
         }
 
-        # Directories that should be monitored
-        should_monitor = {str(self.root_path)}
-        for path_str in self._expanded_paths:
-            should_monitor.add(path_str)
+        # Listings are only worth keeping for directories that are on display
+        for path_str in self._listing_cache.keys() - should_monitor:
+            del self._listing_cache[path_str]
 
         # Get currently monitored directories from service
         currently_monitored = self._file_monitor_service.get_monitored_directories()
@@ -807,9 +1325,8 @@ class FileTree(Gtk.Box):
                 self._file_monitor_service.add_working_tree_monitor(Path(path_str))
 
         # Remove stale monitors (except root)
-        root_str = str(self.root_path)
         for path_str in currently_monitored:
-            if path_str not in should_monitor and path_str != root_str:
+            if path_str not in should_monitor and path_str != self._root_str:
                 self._file_monitor_service.remove_working_tree_monitor(Path(path_str))
 
     def _on_git_status_changed(self, service):
@@ -818,32 +1335,126 @@ class FileTree(Gtk.Box):
         # re-evaluate so git status/icons start loading without a reopen.
         if not self._is_git_repo and self._git_service.is_git_repo():
             self._is_git_repo = True
-        self._schedule_refresh()
+        # Git operations (stage, commit, checkout) only change how rows look;
+        # files they add or remove arrive as working-tree events of their own
+        self._git_status_dirty = True
+        self._schedule_refresh(status_only=True)
 
     def _on_working_tree_changed(self, service, path: str):
         """Handle working tree changes from monitor service."""
-        # Check if .gitignore was changed
-        if path.endswith(".gitignore"):
-            self._load_ignore_patterns()
+        name = os.path.basename(path)
+        if name.endswith(self.EDITOR_TEMP_SUFFIXES) or name in self.EDITOR_TEMP_NAMES:
+            return
+
+        # Check if the root .gitignore was changed (nested ones aren't loaded).
+        # It's re-read once per burst by the scheduled refresh, which decides
+        # whether the tree needs a re-walk (see _reload_gitignore).
+        if path == self._gitignore_str:
+            self._git_status_dirty = True
+            self._gitignore_dirty = True
+            self._schedule_refresh(status_only=True)
+            return
 
-        self._schedule_refresh()
+        # Entries the tree hides can't change what it shows (a .pyc written in
+        # __pycache__, a build dir churning), its rows or their git status
+        if self._is_hidden_entry(path, name):
+            return
 
-    def _schedule_refresh(self):
-        """Coalesce bursty working-tree events into a single rebuild (roadmap 2.9).
+        # Edits in the working tree change `git status` output without touching
+        # .git, so they invalidate the cached status too
+        self._git_status_dirty = True
+        # Only the listing of the directory the event happened in can change
+        self._schedule_refresh(os.path.dirname(path))
+
+    def _is_hidden_entry(self, path: str, name: str) -> bool:
+        """Whether the walk would filter out `path` (memoized ignore check)."""
+        if name in self.ALWAYS_HIDDEN:
+            return True
+        if self._show_ignored or name in self.ALWAYS_VISIBLE:
+            return False
+        if not path.startswith(self._root_prefix):
+            return False
+        # A deleted directory is checked as a file; directory-only patterns
+        # then don't match and the event just refreshes as before
+        return self._is_ignored(path[len(self._root_prefix):], os.path.isdir(path))
+
+    def _schedule_refresh(self, directory: str | None = None, status_only: bool = False):
+        """Coalesce bursty working-tree events (roadmap 2.9).
 
         Without this, a branch switch touching N files fires N full tree rebuilds +
-        N git-status subprocesses. Debouncing + the git-status generation token
-        collapses that to one or two.
+        N git-status subprocesses. The first event after a quiet period refreshes
+        right away (leading edge); events during the following cooldown only mark
+        a refresh as pending, which runs once when the cooldown ends and starts a
+        new one. A long storm therefore still updates the tree every cooldown
+        instead of being postponed until it stops, and the timer is never
+        re-armed per event.
+
+        Args:
+            directory: Only this directory's listing changed (None = the whole
+                tree may have). A refresh covering only directories re-walks
+                just their subtrees.
+            status_only: No listing changed, only git status (which the caller
+                marked dirty) needs reloading; rows are restyled in place
         """
+        if status_only:
+            pass
+        elif directory is None:
+            self._tree_dirty = True
+        else:
+            self._dirty_dirs.add(directory)
         if self._refresh_timeout_id:
-            GLib.source_remove(self._refresh_timeout_id)
-        self._refresh_timeout_id = GLib.timeout_add(200, self._do_scheduled_refresh)
+            return
+        self._do_scheduled_refresh()
+        self._refresh_timeout_id = GLib.timeout_add(
+            self.REFRESH_COOLDOWN_MS, self._on_refresh_cooldown
+        )
 
-    def _do_scheduled_refresh(self) -> bool:
-        self._refresh_timeout_id = 0
-        if self.get_root() is None:
+    def _on_refresh_cooldown(self) -> bool:
+        """End of a cooldown: flush a pending refresh and keep cooling down."""
+        # Unrooted (its window closed) nothing can be refreshed, so pending work
+        # would never clear; stop, the next event starts a new cooldown
+        if self.get_root() is None or not (
+            self._tree_dirty
+            or self._dirty_dirs
+            or self._gitignore_dirty
+            or (self._is_git_repo and self._git_status_dirty)
+        ):
+            self._refresh_timeout_id = 0
             return False
-        self.refresh()
-        # Update monitors for newly expanded/collapsed directories
-        self._update_monitors()
-        return False
+        self._do_scheduled_refresh()
+        return True
+
+    def _reload_gitignore(self):
+        """Re-read the root .gitignore after it changed.
+
+        If it was edited without changing its patterns, the visible entries
+        can't have changed; only its own git status may have, which doesn't
+        need a re-walk. Creating or deleting it does (its own row).
+        """
+        self._gitignore_dirty = False
+        existed = self._ignore_fingerprint is not None
+        patterns_changed = self._load_ignore_patterns()
+        if patterns_changed or existed != (self._ignore_fingerprint is not None):
+            self._tree_dirty = True
+
+    def _do_scheduled_refresh(self):
+        if self._gitignore_dirty:
+            self._reload_gitignore()
+        dirty_dirs, self._dirty_dirs = self._dirty_dirs, set()
+        full = self._tree_dirty or self._root_str in dirty_dirs
+        self._tree_dirty = False
+        if self.get_root() is None:
+            return
+        if full:
+            self.refresh()
+        elif dirty_dirs:
+            # Parents first; a re-walked directory already covers its subtree
+            walked: list[str] = []
+            for directory in sorted(dirty_dirs):
+                if not any(directory.startswith(done + os.sep) for done in walked):
+                    self._refresh_directory(directory)
+                    walked.append(directory)
+        self._reload_git_status_if_dirty()
+        if full or dirty_dirs:
+            # Update monitors for newly expanded/collapsed directories
+            self._update_monitors()
@@ -1,6 +1,9 @@
 """Git changes panel widget."""
 
-import subprocess
+import os
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 
 from gi.repository import Gtk, GLib, GObject, Adw, Gio
@@ -8,6 +11,7 @@ from gi.repository import Gtk, GLib, GObject, Adw, Gio
 from ..services import GitService, GitFileStatus, FileStatus, ToastService, FileMonitorService, AuthenticationRequired, PushRejected, run_async
 from ..services.icon_cache import IconCache
 from ..utils import git_auth
+from ..utils.git_worktree import resolve_worktree_dirs
 from .branch_popover import BranchPopover
 from .stash_popover import StashPopover
 
@@ -22,6 +26,26 @@ STATUS_CSS_CLASSES = {
     FileStatus.TYPECHANGE: "git-modified",
 }
 
+_GIT_CHANGES_CSS = b"""
+.git-modified { color: #f1c40f; }
+.git-added { color: #2ecc71; }
+.git-deleted { color: #e74c3c; }
+.git-renamed { color: #3498db; }
+.git-file-label { font-weight: normal; }
+.git-dir-label { font-weight: normal; }
+"""
+
+
+def _mtimes(paths) -> tuple[int, ...]:
+    """``st_mtime_ns`` of each path (0 if missing), as a cache signature."""
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return tuple(signature)
+
 
 class GitChangesPanel(Gtk.Box):
     """Panel displaying git changes with stage/unstage/commit functionality."""
@@ -31,29 +55,86 @@ class GitChangesPanel(Gtk.Box):
         "branch-changed": (GObject.SignalFlags.RUN_FIRST, None, ()),  # emitted when branch switches
     }
 
-    # Slow fallback poll (ms). FileMonitorService signals drive most refreshes now;
-    # this only catches anything the monitors miss (roadmap 2.4).
-    POLL_INTERVAL = 30000
-    # Debounce window for coalescing bursty refresh triggers (ms).
-    REFRESH_DEBOUNCE = 200
+    # FileMonitorService signals drive refreshes; this watchdog (seconds) only
+    # catches what the monitors miss, e.g. edits under directories that are not
+    # watched, and stays quiet while events keep the panel fresh (roadmap 2.4).
+    WATCHDOG_INTERVAL = 30
+    # Adaptive debounce for bursty refresh triggers (ms): an isolated event waits
+    # REFRESH_DEBOUNCE, each further event in the burst adds REFRESH_DEBOUNCE_STEP
+    # up to REFRESH_DEBOUNCE_MAX, and REFRESH_MAX_WAIT after the burst's first
+    # event a refresh runs anyway so sustained activity still updates the panel.
+    REFRESH_DEBOUNCE = 150
+    REFRESH_DEBOUNCE_STEP = 50
+    REFRESH_DEBOUNCE_MAX = 1000
+    REFRESH_MAX_WAIT = 2000
+    # While a merge/rebase/cherry-pick is in progress git rewrites refs and the
+    # tree in steps; wait longer so the panel doesn't flicker through them.
+    GIT_OP_REFRESH_DEBOUNCE = 2000
+    GIT_OP_REFRESH_MAX_WAIT = 5000
+    # Seconds after which an undelivered refresh worker no longer blocks new ones
+    # (run_async drops results for a panel that left its window). Above the git
+    # status timeout.
+    REFRESH_STALL_TIMEOUT = 35
     # Cap on interactive auth retries before giving up (roadmap 2.2).
     MAX_AUTH_ATTEMPTS = 3
 
+    # File rows realized per section before a "Show more" row. The panel is a
+    # plain Gtk.Box, so this bounds widget count on huge change sets.
+    SECTION_ROW_LIMIT = 300
+    # Row insertions/removals in one update above which the content box is
+    # detached while it is mutated, so GTK relayouts once instead of per row.
+    BULK_CHANGE_THRESHOLD = 200
+
+    # Shared by every panel: installed on the display by the first one.
+    _css_provider: Gtk.CssProvider | None = None
+
     def __init__(self, project_path: str, file_monitor_service: FileMonitorService):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
 
         self.project_path = Path(project_path)
-        self.service = GitService(self.project_path)
+        self.service = GitService.get_or_create(self.project_path)
         self._file_monitor_service = file_monitor_service
         self._icon_cache = IconCache()
         # Track expanded directories per section (staged/unstaged)
         self._expanded_staged: set[str] = set()
         self._expanded_unstaged: set[str] = set()
 
-        # Polling / refresh state
-        self._poll_timeout_id: int | None = None
+        # Refresh scheduling state
+        self._watchdog_id: int = 0
         self._refresh_timeout_id: int = 0
-        self._last_status_hash: str | None = None
+        self._max_wait_timeout_id: int = 0
+        self._burst_count = 0
+        self._last_refresh_monotonic = 0.0
+        # Start time of the refresh worker in flight (0.0 if none), and the
+        # follow-up requested meanwhile: None, or its reuse_status flag
+        self._refresh_started = 0.0
+        self._queued_refresh: bool | None = None
+        self._refresh_cancel: threading.Event | None = None  # kills its git status
+        self._git_op_markers: tuple[str, ...] = ()  # see _resolve_git_dirs
+        self._last_status_hash: int | None = None
+        # Last successfully read (staged, unstaged), for re-layout without git
+        self._status: tuple[list[GitFileStatus], list[GitFileStatus]] | None = None
+        # (extra ref paths, mtime signature, (branch, ahead, behind, has_upstream))
+        self._refs_cache: tuple | None = None
+        # (tree epoch, index/HEAD mtime signature, (staged, unstaged)); the epoch
+        # is bumped when working-tree edits may have gone unseen (watchdog, a
+        # refresh whose event paths were never checked)
+        self._status_cache: tuple | None = None
+        self._tree_epoch = 0
+        # Working-tree event paths since the last refresh started; its worker
+        # checks them against .gitignore before reusing the cached status
+        self._event_paths: set[str] = set()
+        self._git_dir_prefix = ""  # see _resolve_git_dirs
+
+        # Rows reused across refreshes (see _render_changes). The file-row pool
+        # covers every key in the last status, including rows under collapsed dirs.
+        self._section_headers: dict[bool, Gtk.Box] = {}
+        self._dir_rows: dict[tuple[bool, str], Gtk.Box] = {}
+        self._row_pool: dict[tuple[bool, str], Gtk.Box] = {}
+        self._more_rows: dict[bool, Gtk.Box] = {}
+        # Per-section file-row limit, raised page by page via "Show more"
+        self._section_row_limits: dict[bool, int] = {}
+        self._empty_label: Gtk.Label | None = None
 
         # In-flight guard: serializes mutating git ops (2.2/2.3) so a double-click
         # can't produce two commits and slow network ops don't stack.
@@ -61,6 +142,15 @@ class GitChangesPanel(Gtk.Box):
         self._has_staged = False  # cached from the last refresh; gates the Commit button
         self._auth_attempts = 0
         self._remember_creds = False  # opt-in credential persistence (roadmap 3.7)
+        # Fixed-layout dialogs, built on first use and re-presented afterwards
+        self._uncommitted_dialog: Adw.AlertDialog | None = None
+        self._error_dialog: Adw.AlertDialog | None = None
+
+        # FileMonitorService outlives the panel: every handler connected to it is
+        # recorded here and disconnected on destroy, or the service would keep
+        # the whole panel alive and keep dispatching to it.
+        self._monitor_handler_ids: list[int] = []
+        self.connect("destroy", self._on_destroy)
 
         # Check if git repo
         if not self.service.is_git_repo():
@@ -70,21 +160,44 @@ class GitChangesPanel(Gtk.Box):
             self._no_repo_handler_id = self._file_monitor_service.connect(
                 "git-status-changed", self._on_repo_maybe_created
             )
+            self._monitor_handler_ids.append(self._no_repo_handler_id)
             return
 
         self._activate_repo()
 
     def _activate_repo(self):
-        """Build the live changes UI and start monitoring/polling."""
+        """Build the live changes UI and start monitoring."""
         self.service.open()
+        self._resolve_git_dirs()
         self._build_ui()
         self._setup_css()
         self._connect_monitor_signals()
-        self._start_polling()
+        self._watchdog_id = GLib.timeout_add_seconds(self.WATCHDOG_INTERVAL, self._on_watchdog)
         self.refresh()
 
-        # Stop polling on destroy
-        self.connect("destroy", self._on_destroy)
+    def _resolve_git_dirs(self):
+        """Locate the files whose mtimes key the branch / ahead-behind cache.
+
+        A linked worktree keeps HEAD and its reflog in its own gitdir, while
+        config, refs and packed-refs live in the shared common dir.
+        """
+        repo = self.service.repo
+        dirs = resolve_worktree_dirs(repo.workdir) if repo.workdir else None
+        git_dir, common_dir = dirs or (Path(repo.path), Path(repo.path))
+        self._git_common_dir = str(common_dir)
+        self._refs_paths = tuple(str(p) for p in (
+            git_dir / "HEAD",
+            git_dir / "logs" / "HEAD",  # commits, resets, checkouts
+            git_dir / "FETCH_HEAD",     # fetch/pull moved the upstream
+            common_dir / "config",      # upstream set or changed
+            common_dir / "packed-refs",
+        ))
+        self._index_paths = (str(git_dir / "index"), str(git_dir / "HEAD"))
+        self._git_dir_prefix = str(git_dir) + os.sep
+        # Present only while a multi-step operation is in progress
+        self._git_op_markers = tuple(str(git_dir / name) for name in (
+            "rebase-merge", "rebase-apply", "MERGE_HEAD", "CHERRY_PICK_HEAD", "REVERT_HEAD",
+        ))
 
     def _on_repo_maybe_created(self, service):
         """Activate the panel once a repo appears under a previously non-git dir."""
@@ -94,6 +207,7 @@ class GitChangesPanel(Gtk.Box):
             return
         # Drop the temporary watcher and the placeholder, then become live.
         self._file_monitor_service.disconnect(self._no_repo_handler_id)
+        self._monitor_handler_ids.remove(self._no_repo_handler_id)
         if getattr(self, "_no_repo_box", None) is not None:
             self.remove(self._no_repo_box)
             self._no_repo_box = None
@@ -101,33 +215,77 @@ class GitChangesPanel(Gtk.Box):
 
     def _connect_monitor_signals(self):
         """Connect to FileMonitorService signals."""
-        self._file_monitor_service.connect("git-status-changed", self._on_git_status_changed)
-        self._file_monitor_service.connect("working-tree-changed", self._on_working_tree_changed)
+        self._monitor_handler_ids += [
+            self._file_monitor_service.connect("git-status-changed", self._on_git_status_changed),
+            self._file_monitor_service.connect("working-tree-changed", self._on_working_tree_changed),
+        ]
 
     def _on_git_status_changed(self, service):
         """Handle git status changes from monitor service."""
         self._schedule_refresh()
 
     def _on_working_tree_changed(self, service, path: str):
-        """Handle working tree changes from monitor service."""
+        """Handle working tree changes from monitor service.
+
+        Runs per event, so nothing here touches git: the path is only recorded.
+        The scheduled refresh's worker decides whether any of the burst can
+        change git status (build output or dependency writes under an ignored
+        directory can't) before reusing the cached one.
+        """
+        if self._git_dir_prefix and path.startswith(self._git_dir_prefix):
+            return  # the repository's own files, watched as git-status-changed
+        self._event_paths.add(path)
         self._schedule_refresh()
 
+    def _invalidate_status(self):
+        """Make the next scheduled refresh re-run ``git status``."""
+        self._tree_epoch += 1
+
     def _schedule_refresh(self):
         """Coalesce bursty refresh triggers (monitor signals, post-actions) into one.
 
-        Cancels any pending refresh and reschedules; combined with the generation
-        token in refresh(), N rapid triggers produce a single visible refresh
-        (roadmap 2.4).
+        Cancels any pending refresh and reschedules it with a delay that grows
+        with the burst (checkout, npm install, save-all); the max-wait timer
+        bounds how long a sustained burst can hold updates back. Combined with
+        the generation token in refresh(), N rapid triggers produce a single
+        visible refresh (roadmap 2.4).
         """
         if self._refresh_timeout_id:
             GLib.source_remove(self._refresh_timeout_id)
-        self._refresh_timeout_id = GLib.timeout_add(self.REFRESH_DEBOUNCE, self._do_scheduled_refresh)
-
-    def _do_scheduled_refresh(self) -> bool:
-        self._refresh_timeout_id = 0
-        self.refresh()
+            self._burst_count += 1
+        elif time.monotonic() - self._last_refresh_monotonic > self.REFRESH_DEBOUNCE_MAX / 1000:
+            self._burst_count = 0  # quiet since the last refresh: a fresh burst
+        delay = min(self.REFRESH_DEBOUNCE_MAX,
+                    self.REFRESH_DEBOUNCE + self.REFRESH_DEBOUNCE_STEP * self._burst_count)
+        max_wait = self.REFRESH_MAX_WAIT
+        # Still refresh during the operation (a rebase stopped on a conflict must
+        # show it), just less eagerly.
+        if any(map(os.path.exists, self._git_op_markers)):
+            delay = max(delay, self.GIT_OP_REFRESH_DEBOUNCE)
+            max_wait = self.GIT_OP_REFRESH_MAX_WAIT
+        self._refresh_timeout_id = GLib.timeout_add(delay, self._flush_refresh, False)
+        if not self._max_wait_timeout_id:
+            self._max_wait_timeout_id = GLib.timeout_add(max_wait, self._flush_refresh, True)
+
+    def _flush_refresh(self, max_wait: bool) -> bool:
+        """Run the scheduled refresh once either the debounce or max-wait timer fires."""
+        # The firing source is removed by returning False; refresh() drops the other.
+        if max_wait:
+            self._max_wait_timeout_id = 0
+        else:
+            self._refresh_timeout_id = 0
+        self._burst_count //= 2
+        self.refresh(reuse_status=True)
         return False
 
+    def _cancel_scheduled_refresh(self):
+        """Drop pending debounce/max-wait timers (a refresh is starting anyway)."""
+        for attr in ("_refresh_timeout_id", "_max_wait_timeout_id"):
+            source_id = getattr(self, attr)
+            if source_id:
+                GLib.source_remove(source_id)
+                setattr(self, attr, 0)
+
     def _set_busy(self, busy: bool):
         """Enable/disable persistent mutating buttons while a git op is in flight."""
         self._busy = busy
@@ -141,30 +299,27 @@ class GitChangesPanel(Gtk.Box):
         else:
             self._update_commit_button()
 
-    def _start_polling(self):
-        """Start polling git status for changes."""
-        if self._poll_timeout_id is None:
-            self._poll_timeout_id = GLib.timeout_add(
-                self.POLL_INTERVAL, self._poll_git_status
-            )
-
-    def _stop_polling(self):
-        """Stop polling git status."""
-        if self._poll_timeout_id is not None:
-            GLib.source_remove(self._poll_timeout_id)
-            self._poll_timeout_id = None
-
-    def _poll_git_status(self) -> bool:
-        """Poll git status via subprocess (avoids pygit2 GIL blocking)."""
-        self.refresh()
-        return True  # Keep polling
+    def _on_watchdog(self) -> bool:
+        """Refresh only if no event-driven refresh ran for a whole interval."""
+        if time.monotonic() - self._last_refresh_monotonic >= self.WATCHDOG_INTERVAL:
+            self._invalidate_status()  # it exists for edits the monitors missed
+            self._schedule_refresh()
+        return True  # Keep the watchdog running
 
     def _on_destroy(self, widget):
-        """Handle widget destruction."""
-        self._stop_polling()
-        if self._refresh_timeout_id:
-            GLib.source_remove(self._refresh_timeout_id)
-            self._refresh_timeout_id = 0
+        """Handle widget destruction: drop monitor handlers and pending timers.
+
+        Safe to run more than once; each step clears what it released.
+        """
+        handler_ids, self._monitor_handler_ids = self._monitor_handler_ids, []
+        for handler_id in handler_ids:
+            self._file_monitor_service.disconnect(handler_id)
+        if self._watchdog_id:
+            GLib.source_remove(self._watchdog_id)
+            self._watchdog_id = 0
+        self._cancel_scheduled_refresh()
+        if self._refresh_cancel is not None:
+            self._refresh_cancel.set()  # don't leave git status running for nobody
 
     def _build_no_repo_ui(self):
         """Build UI for non-git directories."""
@@ -241,7 +396,7 @@ class GitChangesPanel(Gtk.Box):
         refresh_btn.set_icon_name("view-refresh-symbolic")
         refresh_btn.add_css_class("flat")
         refresh_btn.set_tooltip_text("Refresh")
-        refresh_btn.connect("clicked", lambda b: self.refresh())
+        refresh_btn.connect("clicked", self._on_refresh_clicked)
         header_box.append(refresh_btn)
 
         self.append(header_box)
@@ -256,6 +411,7 @@ class GitChangesPanel(Gtk.Box):
         self.content_box.set_margin_end(12)
         self.content_box.set_margin_bottom(12)
         scrolled.set_child(self.content_box)
+        self.content_scroller = scrolled
 
         self.append(scrolled)
 
@@ -362,71 +518,163 @@ class GitChangesPanel(Gtk.Box):
         self.append(actions_box)
 
     def _setup_css(self):
-        """Set up CSS for git status colors."""
-        css = b"""
-        .git-modified { color: #f1c40f; }
-        .git-added { color: #2ecc71; }
-        .git-deleted { color: #e74c3c; }
-        .git-renamed { color: #3498db; }
-        .git-file-label { font-weight: normal; }
-        .git-dir-label { font-weight: normal; }
-        """
+        """Set up CSS for git status colors (once per app, not per panel)."""
+        if GitChangesPanel._css_provider is not None:
+            return
         provider = Gtk.CssProvider()
-        provider.load_from_data(css)
+        provider.load_from_data(_GIT_CHANGES_CSS)
         Gtk.StyleContext.add_provider_for_display(
             self.get_display(),
             provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
-
-    def refresh(self):
-        """Refresh the changes list asynchronously via git CLI."""
+        GitChangesPanel._css_provider = provider
+
+    def refresh(self, staged: list[GitFileStatus] | None = None,
+                unstaged: list[GitFileStatus] | None = None, reuse_status: bool = False):
+        """Refresh the changes list asynchronously via git CLI.
+
+        Callers that have just read the status themselves pass ``staged`` and
+        ``unstaged`` so the worker reuses them instead of running ``git status``
+        again. Any refresh scheduled earlier is folded into this one: the status
+        it reads is at least as new.
+
+        With ``reuse_status`` (scheduled refreshes), the last status is reused while
+        the index and HEAD mtimes match and no working-tree event arrived since it
+        was read: ref and reflog churn, or the index rewrite ``git status`` itself
+        does, then costs two stat calls. Direct calls (after a mutation, the
+        refresh button) always read afresh.
+        """
+        self._cancel_scheduled_refresh()
         if not hasattr(self, "branch_label"):
             return  # Not a git repo
+        now = time.monotonic()
+        if self._refresh_started and now - self._refresh_started < self.REFRESH_STALL_TIMEOUT:
+            # A worker is still reading: run once more when it lands instead of
+            # stacking git processes. The follow-up reads afresh unless every
+            # request folded into it allowed reuse.
+            queued = self._queued_refresh
+            self._queued_refresh = reuse_status and queued is not False
+            if not reuse_status:
+                # Direct refreshes (after a mutation, the refresh button) want the
+                # new state now: abort the read in flight. Scheduled ones wait, so
+                # a stream of edits can't keep cancelling every read.
+                self._refresh_cancel.set()
+            return
+        self._refresh_started = self._last_refresh_monotonic = now
+        cancel = self._refresh_cancel = threading.Event()
+        event_paths, self._event_paths = self._event_paths, set()
+        known_status = (staged, unstaged) if staged is not None and unstaged is not None else None
 
-        project_dir = str(self.project_path)
         env = git_auth.build_git_env()
+        refs_cache = self._refs_cache
+        tree_epoch = self._tree_epoch
+        status_cache = self._status_cache
 
         def _fetch():
-            branch, ahead, behind = "?", 0, 0
-            staged, unstaged = [], []
+            staged, unstaged = known_status or ([], [])
             error = None
-            # Branch + ahead/behind are best-effort (defaults are fine on failure).
-            try:
-                r = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True, text=True, cwd=project_dir, timeout=10, env=env,
-                )
-                branch = r.stdout.strip() or "HEAD"
-
-                r = subprocess.run(
-                    ["git", "rev-list", "--left-right", "--count", "@{upstream}...HEAD"],
-                    capture_output=True, text=True, cwd=project_dir, timeout=10, env=env,
-                )
-                if r.returncode == 0 and r.stdout.strip():
-                    parts = r.stdout.strip().split()
-                    if len(parts) == 2:
-                        behind, ahead = int(parts[0]), int(parts[1])
-            except Exception:
-                pass
-            # Status is the change list — a failure here must surface, not read
-            # as "No changes". get_porcelain_status is the single status source.
-            try:
-                staged, unstaged = self.service.get_porcelain_status(env=env)
-            except Exception as e:
-                error = str(e)
-            has_upstream = self.service.has_upstream()
-            return (branch, ahead, behind, staged, unstaged, error, has_upstream)
+            # Stat before running git, so a ref or index write racing the read
+            # invalidates the entry on the next refresh instead of hiding behind it.
+            refs_signature = _mtimes(self._refs_paths)
+            index_signature = _mtimes(self._index_paths)
+            # Branch, upstream and ahead/behind only change with the refs: reuse them
+            # while the ref files' mtimes match.
+            cache = refs_cache
+            sync_state = None
+            if cache is not None and refs_signature + _mtimes(cache[0]) == cache[1]:
+                sync_state = cache[2]
+            status_entry = status_cache
+            need_status = known_status is None
+            if need_status and reuse_status and status_entry is not None \
+                    and status_entry[:2] == (tree_epoch, index_signature) \
+                    and all(self.service.is_ignored_untracked(p) for p in event_paths):
+                staged, unstaged = status_entry[2]
+                need_status = False
+            # Status is the change list — a failure here must surface, not read as
+            # "No changes". Branch info alone is best-effort.
+            if sync_state is None:
+                # Refs moved: one `git status --branch` answers both, ahead/behind
+                # included.
+                try:
+                    snap = self.service.get_status_snapshot(env=env, cancel=cancel)
+                except Exception as e:
+                    if need_status:
+                        error = str(e)
+                        status_entry = None
+                    sync_state, cache = ("?", 0, 0, False), None
+                else:
+                    staged, unstaged = snap.staged, snap.unstaged
+                    status_entry = (tree_epoch, index_signature, (staged, unstaged))
+                    sync_state = (snap.branch, snap.ahead, snap.behind, bool(snap.upstream))
+                    extra_paths = self._branch_ref_paths(snap.branch, snap.upstream)
+                    cache = (extra_paths, refs_signature + _mtimes(extra_paths), sync_state)
+            elif need_status:
+                # Working-tree or index change only: skip --branch, whose
+                # ahead/behind count walks history on every call.
+                status_entry = None
+                try:
+                    staged, unstaged = self.service.get_porcelain_status(env=env, cancel=cancel)
+                    status_entry = (tree_epoch, index_signature, (staged, unstaged))
+                except Exception as e:
+                    error = str(e)
+            if cancel.is_set():
+                return None  # superseded: the queued refresh reads again
+            branch, ahead, behind, has_upstream = sync_state
+            return (branch, ahead, behind, staged, unstaged, error, has_upstream, cache,
+                    status_entry)
 
         # run_async gives a generation token (only the newest refresh renders) and a
         # liveness guard for free (roadmap 2.4).
-        run_async(self, worker=_fetch, on_done=lambda data: self._apply_refresh(*data), key="refresh")
+        run_async(self, worker=_fetch, on_done=self._on_refresh_landed,
+                  on_error=self._on_refresh_failed, key="refresh")
+
+    def _on_refresh_landed(self, data: tuple | None):
+        """Apply a refresh result, then run the follow-up queued while it was in flight."""
+        self._refresh_started = 0.0
+        if data is not None:
+            self._apply_refresh(*data)
+        else:
+            self._invalidate_status()  # its event paths went unchecked
+        self._run_queued_refresh()
+
+    def _on_refresh_failed(self, error: Exception):
+        """Surface an unexpected refresh worker failure and release the in-flight slot."""
+        self._refresh_started = 0.0
+        self._invalidate_status()  # its event paths went unchecked
+        self._show_error(str(error))
+        self._run_queued_refresh()
+
+    def _run_queued_refresh(self):
+        """Start the refresh requested while the previous one was in flight, if any."""
+        queued, self._queued_refresh = self._queued_refresh, None
+        if queued is not None:
+            self.refresh(reuse_status=queued)
+
+    def _branch_ref_paths(self, branch: str, upstream: str) -> tuple[str, ...]:
+        """Loose ref files of the branch and its upstream, extending the refs-cache signature.
+
+        The upstream is a short name: a remote-tracking branch, or a local branch
+        when tracking one, so both candidates are watched (a missing file stats as 0).
+        """
+        refs_dir = os.path.join(self._git_common_dir, "refs")
+        paths = []
+        if branch not in ("?", "HEAD"):
+            paths.append(os.path.join(refs_dir, "heads", branch))
+        if upstream:
+            paths.append(os.path.join(refs_dir, "remotes", upstream))
+            paths.append(os.path.join(refs_dir, "heads", upstream))
+        return tuple(paths)
 
     def _apply_refresh(self, branch, ahead, behind, staged, unstaged, error=None,
-                       has_upstream=True):
+                       has_upstream=True, refs_cache=None, status_cache=None):
         """Apply fetched git data to the UI (runs on main thread)."""
         if not hasattr(self, "branch_label"):
             return False
+        # Only the newest refresh lands here, so a stale worker can't resurrect an
+        # entry that was invalidated after it started.
+        self._refs_cache = refs_cache
+        self._status_cache = status_cache
 
         # Update branch name
         self.branch_label.set_label(branch)
@@ -454,66 +702,231 @@ class GitChangesPanel(Gtk.Box):
             self.pull_btn.set_label("Pull")
             self.pull_btn.remove_css_class("suggested-action")
 
-        # Clear content
-        children = []
-        child = self.content_box.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-        for child in children:
-            self.content_box.remove(child)
-
         # A failed status read must not masquerade as a clean tree.
         if error is not None:
             self._has_staged = False
             self._update_commit_button()
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-            box.set_valign(Gtk.Align.CENTER)
-            box.set_margin_top(36)
-            icon = Gtk.Image.new_from_icon_name("dialog-error-symbolic")
-            icon.set_pixel_size(48)
-            box.append(icon)
-            title = Gtk.Label(label="Couldn't read repository status")
-            title.add_css_class("dim-label")
-            box.append(title)
-            detail = Gtk.Label(label=error)
-            detail.add_css_class("dim-label")
-            detail.add_css_class("caption")
-            detail.set_wrap(True)
-            detail.set_justify(Gtk.Justification.CENTER)
-            box.append(detail)
-            retry = Gtk.Button(label="Retry")
-            retry.set_halign(Gtk.Align.CENTER)
-            retry.set_margin_top(4)
-            retry.connect("clicked", lambda _b: self.refresh())
-            box.append(retry)
-            self.content_box.append(box)
+            # Rows stay pooled: the status is unknown, not empty.
+            self._sync_content([self._create_error_box(error)])
             self._last_status_hash = None
+            self._status = None
             return False
 
-        if not staged and not unstaged:
-            label = Gtk.Label(label="No changes")
-            label.add_css_class("dim-label")
-            label.set_margin_top(24)
-            self.content_box.append(label)
-            self._update_commit_button_with(staged)
-            self._last_status_hash = ""
+        # The porcelain parser returns both lists sorted by path, so hashing the
+        # field tuples in order identifies the status without a sort or a repr()
+        # string per refresh. An unchanged status leaves the rows alone.
+        status_hash = hash(tuple((f.path, f.status, f.staged, f.old_path) for f in staged + unstaged))
+        if status_hash == self._last_status_hash:
             return False
+        self._last_status_hash = status_hash
+        self._status = (staged, unstaged)
+
+        self._render_changes(staged, unstaged)
+        self._update_commit_button_with(staged)
+        return False
+
+    def _create_error_box(self, error: str) -> Gtk.Box:
+        """Placeholder shown when the status read failed."""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        box.set_valign(Gtk.Align.CENTER)
+        box.set_margin_top(36)
+        icon = Gtk.Image.new_from_icon_name("dialog-error-symbolic")
+        icon.set_pixel_size(48)
+        box.append(icon)
+        title = Gtk.Label(label="Couldn't read repository status")
+        title.add_css_class("dim-label")
+        box.append(title)
+        detail = Gtk.Label(label=error)
+        detail.add_css_class("dim-label")
+        detail.add_css_class("caption")
+        detail.set_wrap(True)
+        detail.set_justify(Gtk.Justification.CENTER)
+        box.append(detail)
+        retry = Gtk.Button(label="Retry")
+        retry.set_halign(Gtk.Align.CENTER)
+        retry.set_margin_top(4)
+        retry.connect("clicked", lambda _b: self.refresh())
+        box.append(retry)
+        return box
 
-        # Staged section
-        if staged:
-            self._add_section("Staged", staged, is_staged=True)
+    def _render_changes(self, staged: list[GitFileStatus], unstaged: list[GitFileStatus]):
+        """Bring the content box in line with the given status lists.
 
-        # Unstaged section
-        if unstaged:
-            self._add_section("Changes", unstaged, is_staged=False)
+        Rows are keyed by ``(is_staged, path)`` (directory headers by
+        ``(is_staged, dir_path)``, section headers by ``is_staged``) and reused
+        across refreshes: a status change mutates its row in place and only
+        added/removed keys create or drop widgets, so one changed file no longer
+        rebuilds the whole panel.
+        """
+        if not staged and not unstaged:
+            if self._empty_label is None:
+                self._empty_label = Gtk.Label(label="No changes")
+                self._empty_label.add_css_class("dim-label")
+                self._empty_label.set_margin_top(24)
+            self._section_headers, self._dir_rows, self._row_pool = {}, {}, {}
+            self._more_rows = {}
+            self._sync_content([self._empty_label])
+            return
 
-        self._update_commit_button_with(staged)
+        order: list[Gtk.Widget] = []
+        section_headers: dict[bool, Gtk.Box] = {}
+        dir_rows: dict[tuple[bool, str], Gtk.Box] = {}
+        row_pool: dict[tuple[bool, str], Gtk.Box] = {}
+        more_rows: dict[bool, Gtk.Box] = {}
+
+        for title, files, is_staged in (("Staged", staged, True), ("Changes", unstaged, False)):
+            if not files:
+                continue
+            header = self._section_headers.get(is_staged)
+            if header is None:
+                header = self._create_section_header(title, is_staged)
+            header.count_label.set_label(f"{title} ({len(files)})")
+            section_headers[is_staged] = header
+            order.append(header)
+
+            expanded_set = self._expanded_staged if is_staged else self._expanded_unstaged
+            limit = self._section_row_limits.get(is_staged, self.SECTION_ROW_LIMIT)
+            shown = hidden = 0
+            for dir_path, dir_files in self._group_files_by_directory(files).items():
+                if shown >= limit:
+                    # Past this section's page: nothing is realized, rows stay pooled.
+                    hidden += len(dir_files)
+                    self._carry_pooled_rows(is_staged, dir_files, row_pool)
+                    continue
+                indent = bool(dir_path)
+                if dir_path:  # Non-root directory
+                    # Default expanded (not in collapsed set)
+                    is_expanded = dir_path not in expanded_set
+                    key = (is_staged, dir_path)
+                    dir_row = self._dir_rows.get(key)
+                    if dir_row is None:
+                        dir_row = self._create_directory_row(dir_path, len(dir_files), is_expanded, is_staged)
+                    else:
+                        if dir_row.is_expanded != is_expanded:
+                            self._set_directory_expanded(dir_row, is_expanded)
+                        dir_row.count_label.set_label(f"{dir_path}/ ({len(dir_files)})")
+                    dir_rows[key] = dir_row
+                    order.append(dir_row)
+                    # Files under this directory (only if expanded); collapsed
+                    # rows stay pooled so expanding reuses them.
+                    if not is_expanded:
+                        self._carry_pooled_rows(is_staged, dir_files, row_pool)
+                        continue
+
+                if shown + len(dir_files) > limit:
+                    self._carry_pooled_rows(is_staged, dir_files[limit - shown:], row_pool)
+                    hidden += shown + len(dir_files) - limit
+                    dir_files = dir_files[:limit - shown]
+                for file_status in dir_files:
+                    row = self._get_or_create_file_row(file_status, indent)
+                    row_pool[(is_staged, file_status.path)] = row
+                    order.append(row)
+                shown += len(dir_files)
+
+            if hidden:
+                more_row = self._more_rows.get(is_staged)
+                if more_row is None:
+                    more_row = self._create_more_row(is_staged)
+                more_row.button.set_label(
+                    f"Show {min(hidden, self.SECTION_ROW_LIMIT)} more ({hidden} not shown)"
+                )
+                more_rows[is_staged] = more_row
+                order.append(more_row)
+
+        self._section_headers = section_headers
+        self._dir_rows = dir_rows
+        self._more_rows = more_rows
+        # Keys absent from this status drop out of the pool.
+        self._row_pool = row_pool
+        self._sync_content(order)
+
+    def _carry_pooled_rows(self, is_staged: bool, files: list[GitFileStatus],
+                           row_pool: dict[tuple[bool, str], Gtk.Box]):
+        """Keep already-built rows for files that are in the status but not shown."""
+        for file_status in files:
+            key = (is_staged, file_status.path)
+            row = self._row_pool.get(key)
+            if row is not None:
+                row_pool[key] = row
+
+    def _create_more_row(self, is_staged: bool) -> Gtk.Box:
+        """Create the row that reveals the next page of a long section."""
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        box.set_margin_top(2)
+        box.set_margin_bottom(2)
+        button = Gtk.Button()
+        button.add_css_class("flat")
+        button.set_hexpand(True)
+        button.connect("clicked", self._on_show_more_clicked, is_staged)
+        box.append(button)
+        box.button = button
+        return box
 
-        # Update status hash
-        all_files = staged + unstaged
-        self._last_status_hash = str(sorted((f.path, f.status.name, f.staged) for f in all_files))
-        return False
+    def _on_show_more_clicked(self, button, is_staged: bool):
+        """Raise the section's row limit by one page."""
+        limit = self._section_row_limits.get(is_staged, self.SECTION_ROW_LIMIT)
+        self._section_row_limits[is_staged] = limit + self.SECTION_ROW_LIMIT
+        self._rerender()
+
+    def _sync_content(self, order: list[Gtk.Widget]):
+        """Make ``order`` the content box's children, touching only what moved.
+
+        Children not in ``order`` are removed; widgets already in place keep
+        their position, the rest are inserted or reordered after their
+        predecessor. If none of ``order`` is shown yet, the box is simply
+        cleared and refilled.
+        """
+        if all(widget.get_parent() is None for widget in order):
+            # Full replacement (first render, switching to or from a placeholder):
+            # clear head-first without collecting children, then append.
+            scroll_pos = self._detach_content_for(len(order))
+            while (child := self.content_box.get_first_child()) is not None:
+                self.content_box.remove(child)
+            for widget in order:
+                self.content_box.append(widget)
+            self._reattach_content(scroll_pos)
+            return
+
+        keep = set(order)
+        stale = []
+        child = self.content_box.get_first_child()
+        while child is not None:
+            if child not in keep:
+                stale.append(child)
+            child = child.get_next_sibling()
+        added = sum(1 for widget in order if widget.get_parent() is None)
+
+        scroll_pos = self._detach_content_for(len(stale) + added)
+        for child in stale:
+            self.content_box.remove(child)
+        prev = None
+        for widget in order:
+            if widget.get_parent() is None:
+                self.content_box.insert_child_after(widget, prev)
+            elif widget.get_prev_sibling() is not prev:
+                self.content_box.reorder_child_after(widget, prev)
+            prev = widget
+        self._reattach_content(scroll_pos)
+
+    def _detach_content_for(self, changes: int) -> float | None:
+        """Take the content box out of the widget tree if ``changes`` is a bulk batch.
+
+        Returns the scroll position to restore via ``_reattach_content``, or
+        None if the batch is small enough to apply in place.
+        """
+        if changes <= self.BULK_CHANGE_THRESHOLD:
+            return None
+        scroll_pos = self.content_scroller.get_vadjustment().get_value()
+        self.content_scroller.set_child(None)
+        return scroll_pos
+
+    def _reattach_content(self, scroll_pos: float | None):
+        """Undo ``_detach_content_for``, restoring the scroll position on idle."""
+        if scroll_pos is None:
+            return
+        self.content_scroller.set_child(self.content_box)
+        vadj = self.content_scroller.get_vadjustment()
+        GLib.idle_add(lambda: vadj.set_value(scroll_pos) or False)
 
     def _update_commit_button_with(self, staged_files):
         """Cache staged-presence from a fresh refresh, then update the button."""
@@ -527,29 +940,27 @@ class GitChangesPanel(Gtk.Box):
             Dict mapping directory path to list of files.
             Empty string key "" for root-level files.
         """
-        groups: dict[str, list[GitFileStatus]] = {}
+        # git paths are always "/"-separated and relative, so split on the last
+        # "/" instead of building a Path per file
+        groups: defaultdict[str, list[GitFileStatus]] = defaultdict(list)
         for file_status in files:
-            path = Path(file_status.path)
-            parent = str(path.parent) if path.parent != Path(".") else ""
-            if parent not in groups:
-                groups[parent] = []
-            groups[parent].append(file_status)
-
-        # Sort: root first, then alphabetically
-        return dict(sorted(groups.items(), key=lambda x: (x[0] != "", x[0])))
-
-    def _add_section(self, title: str, files: list[GitFileStatus], is_staged: bool):
-        """Add a section (Staged or Changes) to the panel with tree structure."""
-        # Section header
+            groups[file_status.path.rpartition("/")[0]].append(file_status)
+
+        # Sort: root ("") first, then alphabetically — "" already sorts first
+        return dict(sorted(groups.items()))
+
+    def _create_section_header(self, title: str, is_staged: bool) -> Gtk.Box:
+        """Create a section (Staged or Changes) header with its stage/unstage-all button."""
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         header_box.set_margin_top(6)
         header_box._section_name = title  # section tag (Staged/Changes)
 
-        label = Gtk.Label(label=f"{title} ({len(files)})")
+        label = Gtk.Label()
         label.set_xalign(0)
         label.set_hexpand(True)
         label.add_css_class("dim-label")
         header_box.append(label)
+        header_box.count_label = label
 
         # Stage/Unstage all button
         all_btn = Gtk.Button()
@@ -560,29 +971,7 @@ class GitChangesPanel(Gtk.Box):
         all_btn.connect("clicked", self._on_stage_all_clicked, is_staged)
         header_box.append(all_btn)
 
-        self.content_box.append(header_box)
-
-        # Group files by directory
-        groups = self._group_files_by_directory(files)
-        expanded_set = self._expanded_staged if is_staged else self._expanded_unstaged
-
-        for dir_path, dir_files in groups.items():
-            if dir_path:  # Non-root directory
-                # Directory header row
-                is_expanded = dir_path not in expanded_set  # Default expanded (not in collapsed set)
-                dir_row = self._create_directory_row(dir_path, len(dir_files), is_expanded, is_staged)
-                self.content_box.append(dir_row)
-
-                # Files under this directory (only if expanded)
-                if is_expanded:
-                    for file_status in dir_files:
-                        row = self._create_file_row(file_status, indent=True)
-                        self.content_box.append(row)
-            else:
-                # Root-level files (no directory header)
-                for file_status in dir_files:
-                    row = self._create_file_row(file_status, indent=False)
-                    self.content_box.append(row)
+        return header_box
 
     def _create_directory_row(self, dir_path: str, file_count: int, is_expanded: bool, is_staged: bool) -> Gtk.Box:
         """Create a collapsible directory header row."""
@@ -603,9 +992,9 @@ class GitChangesPanel(Gtk.Box):
         arrow.add_css_class("dim-label")
         click_box.append(arrow)
 
-        # Folder icon
-        folder_path = self.project_path / dir_path
-        gicon = self._icon_cache.get_folder_gicon(folder_path, is_open=is_expanded)
+        # Folder icon (memoized by name in IconCache; no stat, shared Gio.Icon)
+        gicon = self._icon_cache.get_gicon_for_name(dir_path.rpartition("/")[2], True, is_expanded)
+        folder_icon = None
         if gicon:
             folder_icon = Gtk.Image.new_from_gicon(gicon)
             folder_icon.set_pixel_size(16)
@@ -617,6 +1006,11 @@ class GitChangesPanel(Gtk.Box):
         label.add_css_class("dim-label")
         label.add_css_class("git-dir-label")
         click_box.append(label)
+        box.count_label = label
+        box.arrow = arrow
+        box.folder_icon = folder_icon
+        box.dir_name = dir_path.rpartition("/")[2]
+        box.is_expanded = is_expanded
 
         # Make clickable via button
         dir_btn = Gtk.Button()
@@ -628,6 +1022,20 @@ class GitChangesPanel(Gtk.Box):
 
         return box
 
+    def _set_directory_expanded(self, row: Gtk.Box, is_expanded: bool):
+        """Flip a directory header's arrow and folder icon in place."""
+        row.arrow.set_from_icon_name("pan-down-symbolic" if is_expanded else "pan-end-symbolic")
+        if row.folder_icon is not None:
+            gicon = self._icon_cache.get_gicon_for_name(row.dir_name, True, is_expanded)
+            if gicon:
+                row.folder_icon.set_from_gicon(gicon)
+        row.is_expanded = is_expanded
+
+    def _on_refresh_clicked(self, button):
+        """Manual refresh: also re-read the branch and ahead/behind."""
+        self._refs_cache = None
+        self.refresh()
+
     def _on_directory_clicked(self, button, dir_path: str, is_staged: bool):
         """Toggle directory expand/collapse."""
         expanded_set = self._expanded_staged if is_staged else self._expanded_unstaged
@@ -638,7 +1046,14 @@ class GitChangesPanel(Gtk.Box):
         else:
             expanded_set.add(dir_path)
 
-        self.refresh()
+        self._rerender()
+
+    def _rerender(self):
+        """Re-lay out the rows from the last status without running git again."""
+        if self._status is not None:
+            self._render_changes(*self._status)
+        else:
+            self.refresh()
 
     def _create_file_row(self, file_status: GitFileStatus, indent: bool = False) -> Gtk.Box:
         """Create a row for a file."""
@@ -655,9 +1070,8 @@ class GitChangesPanel(Gtk.Box):
             status_label.add_css_class(css_class)
         box.append(status_label)
 
-        # File icon
-        file_path = self.project_path / file_status.path
-        gicon = self._icon_cache.get_file_gicon(file_path)
+        # File icon (memoized by name in IconCache; no stat, shared Gio.Icon)
+        gicon = self._icon_cache.get_gicon_for_name(file_status.display_name, False)
         if gicon:
             file_icon = Gtk.Image.new_from_gicon(gicon)
             file_icon.set_pixel_size(16)
@@ -668,12 +1082,7 @@ class GitChangesPanel(Gtk.Box):
         file_btn.add_css_class("flat")
         file_btn.set_hexpand(True)
 
-        display_name = Path(file_status.path).name
-        tooltip = file_status.path
-        # Show renames as "old → new" so the pairing isn't lost.
-        if file_status.old_path:
-            display_name = f"{Path(file_status.old_path).name} → {display_name}"
-            tooltip = f"{file_status.old_path} → {file_status.path}"
+        display_name, tooltip = self._file_label_text(file_status)
         file_label = Gtk.Label(label=display_name)
         file_label.set_xalign(0)
         file_label.set_ellipsize(2)  # PANGO_ELLIPSIZE_MIDDLE
@@ -686,13 +1095,9 @@ class GitChangesPanel(Gtk.Box):
         box.append(file_btn)
 
         # Restore button (only for deleted/modified unstaged files)
-        if not file_status.staged and file_status.status in (FileStatus.DELETED, FileStatus.MODIFIED):
-            restore_btn = Gtk.Button()
-            restore_btn.set_icon_name("edit-undo-symbolic")
-            restore_btn.add_css_class("flat")
-            restore_btn.add_css_class("circular")
-            restore_btn.set_tooltip_text("Restore from HEAD")
-            restore_btn.connect("clicked", self._on_restore_clicked, file_status)
+        restore_btn = None
+        if self._has_restore_button(file_status):
+            restore_btn = self._create_restore_button(file_status)
             box.append(restore_btn)
 
         # Stage/Unstage button
@@ -704,8 +1109,84 @@ class GitChangesPanel(Gtk.Box):
         action_btn.connect("clicked", self._on_stage_clicked, file_status)
         box.append(action_btn)
 
+        box.file_status = file_status
+        box.css_class = css_class  # status colour class currently applied
+        box.status_label = status_label
+        box.file_btn = file_btn
+        box.file_label = file_label
+        box.restore_btn = restore_btn
         return box
 
+    @staticmethod
+    def _file_label_text(file_status: GitFileStatus) -> tuple[str, str]:
+        """(display name, tooltip) for a file row."""
+        display_name = file_status.display_name
+        tooltip = file_status.path
+        # Show renames as "old → new" so the pairing isn't lost.
+        if file_status.old_path:
+            display_name = f"{file_status.old_path.rpartition('/')[2]} → {display_name}"
+            tooltip = f"{file_status.old_path} → {file_status.path}"
+        return display_name, tooltip
+
+    @staticmethod
+    def _has_restore_button(file_status: GitFileStatus) -> bool:
+        """Restore is offered only for deleted/modified unstaged files."""
+        return not file_status.staged and file_status.status in (FileStatus.DELETED, FileStatus.MODIFIED)
+
+    def _create_restore_button(self, file_status: GitFileStatus) -> Gtk.Button:
+        restore_btn = Gtk.Button()
+        restore_btn.set_icon_name("edit-undo-symbolic")
+        restore_btn.add_css_class("flat")
+        restore_btn.add_css_class("circular")
+        restore_btn.set_tooltip_text("Restore from HEAD")
+        restore_btn.connect("clicked", self._on_restore_clicked, file_status)
+        return restore_btn
+
+    def _get_or_create_file_row(self, file_status: GitFileStatus, indent: bool) -> Gtk.Box:
+        """The pooled row for ``file_status``'s key brought up to date, or a new row.
+
+        The key ``(staged, path)`` fixes the indent and the stage/unstage button,
+        so a pooled row never needs rebuilding.
+        """
+        row = self._row_pool.get((file_status.staged, file_status.path))
+        if row is None:
+            return self._create_file_row(file_status, indent=indent)
+        self._update_file_row(row, file_status)
+        return row
+
+    def _update_file_row(self, row: Gtk.Box, file_status: GitFileStatus):
+        """Patch a pooled row in place: status letter/colour, rename text, restore button."""
+        old = row.file_status
+        if old == file_status:
+            return
+
+        if old.status != file_status.status:
+            old_class = row.css_class
+            new_class = STATUS_CSS_CLASSES.get(file_status.status, "")
+            row.status_label.set_label(file_status.status.value)
+            if old_class != new_class:
+                for widget in (row.status_label, row.file_label):
+                    if old_class:
+                        widget.remove_css_class(old_class)
+                    if new_class:
+                        widget.add_css_class(new_class)
+                row.css_class = new_class
+
+        if old.old_path != file_status.old_path:
+            display_name, tooltip = self._file_label_text(file_status)
+            row.file_label.set_label(display_name)
+            row.file_label.set_tooltip_text(tooltip)
+
+        if self._has_restore_button(file_status):
+            if row.restore_btn is None:
+                row.restore_btn = self._create_restore_button(file_status)
+                row.insert_child_after(row.restore_btn, row.file_btn)
+        elif row.restore_btn is not None:
+            row.remove(row.restore_btn)
+            row.restore_btn = None
+
+        row.file_status = file_status
+
     def _on_file_clicked(self, button, file_status: GitFileStatus):
         """Handle file click - emit signal to show diff."""
         self.emit("file-clicked", file_status.path, file_status.staged)
@@ -796,9 +1277,15 @@ class GitChangesPanel(Gtk.Box):
         self.commit_buffer.set_text("")
 
     def _on_commit_entry_changed(self, *args):
-        """Toggle the placeholder and refresh button state on message edits."""
-        self._commit_placeholder.set_visible(self.commit_buffer.get_char_count() == 0)
-        self._update_commit_button()
+        """Toggle the placeholder when the message becomes empty or non-empty.
+
+        Runs on every keystroke, so it reads no git state and leaves the Commit
+        button alone: its sensitivity depends only on the busy flag (see
+        ``_update_commit_button``), which typing can't change.
+        """
+        is_empty = self.commit_buffer.get_char_count() == 0
+        if is_empty != self._commit_placeholder.get_visible():
+            self._commit_placeholder.set_visible(is_empty)
 
     def _update_commit_button(self):
         """Keep Commit clickable except mid-op.
@@ -826,6 +1313,7 @@ class GitChangesPanel(Gtk.Box):
             self._set_busy(False)
             self._clear_commit_message()
             self._show_toast(f"Committed: {commit_hash}")
+            self._refs_cache = None  # HEAD / upstream moved
             self.refresh()
 
         def err(e):
@@ -839,19 +1327,32 @@ class GitChangesPanel(Gtk.Box):
         if self._busy:
             return
         message = self._commit_message()
-        if not message:
-            last = self.service.get_head_message()
-            if last:
-                self.commit_buffer.set_text(last)
-                self._show_toast("Loaded last commit message — edit, then Amend again")
+        self._set_busy(True)
+
+        def work():
+            if not message:
+                return self.service.get_head_message()
+            # Rewriting an already-pushed commit needs a force-push afterwards → confirm.
+            return self.service.has_upstream() and self.service.get_ahead_behind()[0] == 0
+
+        def done(result):
+            self._set_busy(False)
+            if not message:
+                if result:
+                    self.commit_buffer.set_text(result)
+                    self._show_toast("Loaded last commit message — edit, then Amend again")
+                else:
+                    self._show_error("No commit to amend")
+            elif result:
+                self._confirm_amend(message)
             else:
-                self._show_error("No commit to amend")
-            return
-        # Rewriting an already-pushed commit needs a force-push afterwards → confirm.
-        if self.service.has_upstream() and self.service.get_ahead_behind()[0] == 0:
-            self._confirm_amend(message)
-        else:
-            self._do_amend(message)
+                self._do_amend(message)
+
+        def err(e):
+            self._set_busy(False)
+            self._show_error(f"Amend failed: {e}")
+
+        run_async(self, worker=work, on_done=done, on_error=err, key="mutate")
 
     def _confirm_amend(self, message: str):
         dialog = Adw.AlertDialog()
@@ -880,6 +1381,7 @@ class GitChangesPanel(Gtk.Box):
             self._set_busy(False)
             self._clear_commit_message()
             self._show_toast(f"Amended: {commit_hash}")
+            self._refs_cache = None  # HEAD / upstream moved
             self.refresh()
 
         def err(e):
@@ -892,10 +1394,18 @@ class GitChangesPanel(Gtk.Box):
         """Run ``op`` (a push/pull entry point), warning first if the remote is SSH but
         the ssh-agent has no identities — the common cause of a failed SSH auth, where
         the username/password dialog would be useless. The user can still proceed.
+        The ``ssh-add -l`` probe runs off-thread.
         """
         remote = self.service.get_remote()
         url = remote.url if remote else ""
-        if url and git_auth.is_ssh_remote(url) and not git_auth.ssh_agent_has_keys():
+        if not (url and git_auth.is_ssh_remote(url)):
+            op()
+            return
+
+        def done(has_keys):
+            if has_keys:
+                op()
+                return
             dialog = Adw.AlertDialog()
             dialog.set_heading("No SSH key loaded")
             dialog.set_body(
@@ -909,8 +1419,8 @@ class GitChangesPanel(Gtk.Box):
             dialog.set_close_response("cancel")
             dialog.connect("response", lambda _d, r: op() if r == "continue" else None)
             dialog.present(self.get_root())
-        else:
-            op()
+
+        run_async(self, worker=git_auth.ssh_agent_has_keys, on_done=done, key="ssh-precheck")
 
     def _on_pull_clicked(self, button):
         """Handle pull button click (SSH pre-check, then off-thread dirty check)."""
@@ -923,11 +1433,17 @@ class GitChangesPanel(Gtk.Box):
         self._set_busy(True)
 
         def work():
-            return self.service.has_uncommitted_changes()
+            try:
+                return self.service.get_porcelain_status()
+            except (RuntimeError, OSError):
+                return None  # unknown — don't block the pull (as has_uncommitted_changes)
 
-        def done(dirty):
+        def done(status):
             self._set_busy(False)
-            if dirty:
+            if status is not None:
+                # The dirty check just read the full status; show it without a second run.
+                self.refresh(*status)
+            if status is not None and (status[0] or status[1]):
                 self._show_uncommitted_warning()
             else:
                 self._do_pull()
@@ -939,7 +1455,16 @@ class GitChangesPanel(Gtk.Box):
         run_async(self, worker=work, on_done=done, on_error=err, key="mutate")
 
     def _show_uncommitted_warning(self):
-        """Show warning about uncommitted changes before pull."""
+        """Show warning about uncommitted changes before pull (built once, then reused).
+
+        While it is still up a second request adds nothing: its content is fixed
+        and answering "Pull Anyway" pulls once.
+        """
+        dialog = self._uncommitted_dialog
+        if dialog is not None:
+            if not dialog.is_open:
+                self._present_dialog(dialog)
+            return
         dialog = Adw.AlertDialog()
         dialog.set_heading("Uncommitted Changes")
         dialog.set_body(
@@ -952,8 +1477,18 @@ class GitChangesPanel(Gtk.Box):
         dialog.set_default_response("cancel")
         dialog.set_close_response("cancel")
         dialog.connect("response", self._on_uncommitted_warning_response)
+        dialog.connect("closed", self._on_reused_dialog_closed)
+        self._uncommitted_dialog = dialog
+        self._present_dialog(dialog)
+
+    def _present_dialog(self, dialog: Adw.AlertDialog):
+        """Present a reusable dialog, marking it open until it closes."""
+        dialog.is_open = True
         dialog.present(self.get_root())
 
+    def _on_reused_dialog_closed(self, dialog):
+        dialog.is_open = False
+
     def _on_uncommitted_warning_response(self, dialog, response: str):
         """Handle uncommitted warning dialog response."""
         if response == "pull":
@@ -973,6 +1508,7 @@ class GitChangesPanel(Gtk.Box):
             self._auth_attempts = 0
             self._set_busy(False)
             self._show_toast(result)
+            self._refs_cache = None  # HEAD / upstream moved
             self.refresh()
             self._file_monitor_service.emit("git-history-changed")
 
@@ -1008,6 +1544,7 @@ class GitChangesPanel(Gtk.Box):
             self._auth_attempts = 0
             self._set_busy(False)
             self._show_toast(result)
+            self._refs_cache = None  # HEAD / upstream moved
             self.refresh()  # Update counts
             self._file_monitor_service.emit("git-history-changed")
 
@@ -1104,6 +1641,7 @@ class GitChangesPanel(Gtk.Box):
 
     def _on_branch_switched(self, popover):
         """Handle branch switch - refresh and notify."""
+        self._refs_cache = None  # HEAD / upstream moved
         self.refresh()
         self.emit("branch-changed")
 
@@ -1116,9 +1654,23 @@ class GitChangesPanel(Gtk.Box):
         ToastService.show_error(message)
 
     def _show_error_dialog(self, title: str, message: str):
-        """Show error dialog with copy button."""
-        dialog = Adw.AlertDialog()
+        """Show error dialog with copy button (built once, then refilled).
+
+        An error arriving while that dialog is still up gets one of its own
+        rather than overwriting the message being read (and copied).
+        """
+        dialog = self._error_dialog
+        if dialog is None or dialog.is_open:
+            dialog = self._build_error_dialog()
+            if self._error_dialog is None:
+                self._error_dialog = dialog
         dialog.set_heading(title)
+        dialog.text_view.get_buffer().set_text(message)
+        dialog.message = message
+        self._present_dialog(dialog)
+
+    def _build_error_dialog(self) -> Adw.AlertDialog:
+        dialog = Adw.AlertDialog()
 
         # Create scrollable text view for error message
         text_view = Gtk.TextView()
@@ -1126,7 +1678,6 @@ class GitChangesPanel(Gtk.Box):
         text_view.set_cursor_visible(False)
         text_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
         text_view.set_monospace(True)
-        text_view.get_buffer().set_text(message)
         text_view.set_margin_top(8)
         text_view.set_margin_bottom(8)
         text_view.set_margin_start(8)
@@ -1149,15 +1700,16 @@ class GitChangesPanel(Gtk.Box):
         dialog.set_default_response("close")
         dialog.set_close_response("close")
 
-        dialog.connect("response", self._on_error_dialog_response, message)
-
-        # Find parent window
-        parent = self.get_root()
-        dialog.present(parent)
+        dialog.connect("response", self._on_error_dialog_response)
+        dialog.connect("closed", self._on_reused_dialog_closed)
+        dialog.text_view = text_view
+        dialog.message = ""
+        dialog.is_open = False
+        return dialog
 
-    def _on_error_dialog_response(self, dialog, response: str, message: str):
+    def _on_error_dialog_response(self, dialog, response: str):
         """Handle error dialog response."""
         if response == "copy":
             clipboard = self.get_clipboard()
-            clipboard.set(message)
+            clipboard.set(dialog.message)
             ToastService.show("Error copied to clipboard")
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from gi.repository import Gtk, Gio, GObject, Adw
 
-from ..services import GitService, ToastService, FileMonitorService
+from ..services import GitService, ToastService, FileMonitorService, run_async
 from ..utils.relative_time import humanize_relative
 
 
@@ -23,6 +23,9 @@ class GitHistoryPanel(Gtk.Box):
         self._selected_commit = None
         self._all_commits = []  # Cache all commits for filtering
         self._filter_text = ""
+        # Rows keyed by commit hash, reused across filtering and refreshes
+        self._rows: dict[str, Gtk.ListBoxRow] = {}
+        self._shown_rows: list[Gtk.ListBoxRow] = []  # in list order
 
         self._build_ui()
         self._setup_css()
@@ -112,6 +115,12 @@ class GitHistoryPanel(Gtk.Box):
         self.commits_list.connect("row-selected", self._on_row_selected)
         self.commits_list.connect("row-activated", self._on_row_activated)
 
+        # Shown while the list has no rows: empty history, no match, or an error
+        self._placeholder = Gtk.Label()
+        self._placeholder.add_css_class("dim-label")
+        self._placeholder.set_margin_top(24)
+        self.commits_list.set_placeholder(self._placeholder)
+
         scrolled.set_child(self.commits_list)
         self.append(scrolled)
 
@@ -162,27 +171,43 @@ class GitHistoryPanel(Gtk.Box):
         self.insert_action_group("reset", action_group)
 
     def refresh(self):
-        """Refresh the commits list."""
+        """Refresh the commits list.
+
+        The history walk runs off the main thread; run_async's generation token
+        means a burst of monitor events or actions only applies the newest read.
+        The shown list is handed back so a HEAD that only moved forward costs a
+        walk over the new commits instead of the whole history.
+        """
+        known = self._all_commits
+        run_async(
+            self,
+            worker=lambda: self.service.get_commits(limit=50, known=known),
+            on_done=self._apply_commits,
+            on_error=self._apply_commits_error,
+            key="refresh",
+        )
+
+    def _apply_commits(self, commits):
+        """Show freshly read commits, keeping the selection (runs on main thread)."""
         # Save current selection
         selected_hash = None
         if self._selected_commit:
             selected_hash = self._selected_commit.hash
 
-        # Clear existing
-        self.commits_list.remove_all()
-        self._selected_commit = None
+        self._all_commits = commits
+        self._display_commits(selected_hash)
 
-        # Get commits
-        try:
-            self._all_commits = self.service.get_commits(limit=50)
-        except Exception as e:
-            label = Gtk.Label(label=f"Error: {e}")
-            label.add_css_class("dim-label")
-            self.commits_list.append(label)
-            self._update_buttons()
-            return
+        # Rows of commits that left the history can't come back
+        if len(self._rows) > len(self._all_commits):
+            hashes = {c.hash for c in self._all_commits}
+            self._rows = {h: row for h, row in self._rows.items() if h in hashes}
 
-        self._display_commits(selected_hash)
+    def _apply_commits_error(self, error: Exception):
+        """Replace the list with the read error (runs on main thread)."""
+        self._set_rows([])
+        self._selected_commit = None
+        self._placeholder.set_label(f"Error: {error}")
+        self._update_buttons()
 
     def _on_search_changed(self, entry):
         """Handle search entry changes."""
@@ -192,47 +217,42 @@ class GitHistoryPanel(Gtk.Box):
         self._display_commits(selected_hash)
 
     def _display_commits(self, selected_hash: str = None):
-        """Display commits with current filter, optionally restoring selection."""
-        self.commits_list.remove_all()
+        """Display commits with current filter, optionally restoring selection.
 
+        Rows are reused by commit hash: narrowing the filter only removes rows,
+        widening it re-inserts the existing ones, and a refresh creates rows
+        only for new commits.
+        """
         if not self._all_commits:
-            label = Gtk.Label(label="No commits yet")
-            label.add_css_class("dim-label")
-            label.set_margin_top(24)
-            self.commits_list.append(label)
+            self._set_rows([])
+            self._selected_commit = None
+            self._placeholder.set_label("No commits yet")
             self._update_buttons()
             return
 
         # Filter commits
         if self._filter_text:
-            filtered = [
-                c for c in self._all_commits
-                if self._filter_text in c.message.lower()
-                or self._filter_text in c.author.lower()
-                or self._filter_text in c.short_hash.lower()
-            ]
+            filtered = [c for c in self._all_commits if self._filter_text in c.search_key]
         else:
             filtered = self._all_commits
 
         if not filtered:
-            label = Gtk.Label(label="No matching commits")
-            label.add_css_class("dim-label")
-            label.set_margin_top(24)
-            self.commits_list.append(label)
+            self._set_rows([])
+            self._selected_commit = None
+            self._placeholder.set_label("No matching commits")
             self._update_buttons()
             return
 
-        # Rebuild list and restore selection
-        row_to_select = None
-        for commit in filtered:
-            row = self._create_commit_row(commit)
-            self.commits_list.append(row)
-            if selected_hash and commit.hash == selected_hash:
-                row_to_select = row
+        now = datetime.now()  # one clock read for every row's relative time
+        rows = [self._get_commit_row(commit, now) for commit in filtered]
+        self._set_rows(rows)
 
         # Restore selection or clear if not found
-        if row_to_select:
-            self.commits_list.select_row(row_to_select)
+        row_to_select = self._rows.get(selected_hash) if selected_hash else None
+        if row_to_select is not None and row_to_select in self._shown_rows:
+            if self.commits_list.get_selected_row() is not row_to_select:
+                self.commits_list.select_row(row_to_select)
+            self._selected_commit = row_to_select.commit  # may be a refreshed object
         else:
             # Selected commit no longer in filtered list
             self._selected_commit = None
@@ -240,6 +260,39 @@ class GitHistoryPanel(Gtk.Box):
         # Always update buttons to reflect current state
         self._update_buttons()
 
+    def _set_rows(self, rows: list[Gtk.ListBoxRow]):
+        """Make the list show exactly ``rows`` in order, touching only rows that moved."""
+        wanted = set(rows)
+        for row in self._shown_rows:
+            if row not in wanted:
+                self.commits_list.remove(row)
+        shown = [row for row in self._shown_rows if row in wanted]
+        present = set(shown)
+        for index, row in enumerate(rows):
+            if index < len(shown) and shown[index] is row:
+                continue
+            if row in present:
+                self.commits_list.remove(row)
+                shown.remove(row)
+            self.commits_list.insert(row, index)
+            shown.insert(index, row)
+            present.add(row)
+        self._shown_rows = shown
+
+    def _get_commit_row(self, commit, now: datetime) -> Gtk.ListBoxRow:
+        """The row for ``commit``, reusing the one built for its hash.
+
+        Its relative time is brought up to date on every display, filtering
+        included, so a row shown again later doesn't keep its old age.
+        """
+        row = self._rows.get(commit.hash)
+        if row is None:
+            row = self._rows[commit.hash] = self._create_commit_row(commit)
+        elif row.commit is not commit:
+            self._update_commit_row(row, commit)
+        self._update_row_meta(row, now)
+        return row
+
     def _create_commit_row(self, commit) -> Gtk.ListBoxRow:
         """Create a row for a commit."""
         row = Gtk.ListBoxRow()
@@ -255,11 +308,7 @@ class GitHistoryPanel(Gtk.Box):
         top_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
 
         # HEAD indicator
-        indicator = Gtk.Label(label="●" if commit.is_head else "○")
-        if commit.is_head:
-            indicator.add_css_class("commit-head")
-        else:
-            indicator.add_css_class("dim-label")
+        indicator = Gtk.Label()
         top_box.append(indicator)
 
         # Hash
@@ -268,11 +317,10 @@ class GitHistoryPanel(Gtk.Box):
         top_box.append(hash_label)
 
         # HEAD badge
-        if commit.is_head:
-            head_badge = Gtk.Label(label="HEAD")
-            head_badge.add_css_class("commit-head")
-            head_badge.set_margin_start(6)
-            top_box.append(head_badge)
+        head_badge = Gtk.Label(label="HEAD")
+        head_badge.add_css_class("commit-head")
+        head_badge.set_margin_start(6)
+        top_box.append(head_badge)
 
         box.append(top_box)
 
@@ -285,9 +333,7 @@ class GitHistoryPanel(Gtk.Box):
         box.append(message_label)
 
         # Author and time
-        relative_time = self._format_relative_time(commit.timestamp)
-        meta_text = f"{commit.author} · {relative_time}"
-        meta_label = Gtk.Label(label=meta_text)
+        meta_label = Gtk.Label()
         meta_label.set_xalign(0)
         meta_label.add_css_class("commit-meta")
         meta_label.add_css_class("dim-label")
@@ -295,11 +341,32 @@ class GitHistoryPanel(Gtk.Box):
         box.append(meta_label)
 
         row.set_child(box)
+        row.indicator = indicator
+        row.head_badge = head_badge
+        row.meta_label = meta_label
+        row.meta_text = None
+        self._update_commit_row(row, commit)
         return row
 
-    def _format_relative_time(self, timestamp: datetime) -> str:
+    def _update_commit_row(self, row: Gtk.ListBoxRow, commit):
+        """Apply what can change for a commit hash besides its age: HEAD state."""
+        row.commit = commit
+        row.indicator.set_label("●" if commit.is_head else "○")
+        row.indicator.set_css_classes(["commit-head" if commit.is_head else "dim-label"])
+        row.head_badge.set_visible(commit.is_head)
+
+    def _update_row_meta(self, row: Gtk.ListBoxRow, now: datetime):
+        """Show the author and the commit's age as of ``now``."""
+        commit = row.commit
+        relative_time = self._format_relative_time(commit.timestamp, now)
+        meta_text = f"{commit.author} · {relative_time}"
+        if meta_text != row.meta_text:  # usually unchanged between displays
+            row.meta_text = meta_text
+            row.meta_label.set_label(meta_text)
+
+    def _format_relative_time(self, timestamp: datetime, now: datetime) -> str:
         """Format timestamp as relative time (shared helper)."""
-        return humanize_relative(timestamp)
+        return humanize_relative(timestamp, now)
 
     def _on_row_selected(self, listbox, row):
         """Handle commit selection."""
@@ -49,7 +49,7 @@ class NotesPanel(Gtk.Box):
         self._icon_cache = IconCache()
 
         # Git service for file status
-        self._git_service = GitService(self.project_path)
+        self._git_service = GitService.get_or_create(self.project_path)
         self._is_git_repo = self._git_service.is_git_repo()
         if self._is_git_repo:
             self._git_service.open()
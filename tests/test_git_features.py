@@ -1,5 +1,8 @@
 """Phase 4 git backend (CLI): commit/branch migration + amend/checkout/upstream."""
 
+import threading
+
+import pygit2
 import pytest
 
 from src.services.git_service import GitService
@@ -152,3 +155,60 @@ def test_checkout_remote_tracking(tmp_path):
     assert git(cons, "rev-parse", "--abbrev-ref", "feature@{upstream}") == "origin/feature"
     # Idempotent: calling again when the local branch exists just switches to it.
     assert svc.checkout_remote_tracking("origin/feature") == "feature"
+
+
+def test_get_or_create_shares_one_instance_per_path(tmp_path):
+    path, _ = _repo(tmp_path)
+    shared = GitService.get_or_create(path)
+    assert GitService.get_or_create(str(path)) is shared
+    assert shared.open() and shared.open()
+    repo = shared.repo
+    shared.open()
+    assert shared.repo is repo  # re-opening keeps the live Repository
+    assert GitService.get_or_create(tmp_path / "other") is not shared
+
+
+def test_get_commits_extends_known_list(tmp_path):
+    path, svc = _repo(tmp_path)
+    for i in range(4):
+        git(path, "commit", "-q", "--allow-empty", "-m", f"c{i}")
+    known = svc.get_commits(limit=3)
+    assert svc.get_commits(limit=3, known=known) == known
+
+    git(path, "commit", "-q", "--allow-empty", "-m", "next")
+    extended = svc.get_commits(limit=3, known=known)
+    assert extended == svc.get_commits(limit=3)
+    assert [c.message for c in extended] == ["next", "c3", "c2"]
+    assert [c.is_head for c in extended] == [True, False, False]
+
+    git(path, "reset", "-q", "--hard", "HEAD~3")  # not a descendant: full walk
+    assert svc.get_commits(limit=3, known=extended) == svc.get_commits(limit=3)
+
+
+def test_get_commits_keeps_skewed_head_first(tmp_path):
+    path, svc = _repo(tmp_path)
+    for i in range(4):
+        git(path, "commit", "-q", "--allow-empty", "-m", f"m{i + 1}")
+    known = svc.get_commits(limit=4)
+
+    # A new HEAD whose clock was behind its parent's (e.g. another machine)
+    repo = svc.repo
+    parent = repo.head.peel(pygit2.Commit)
+    sig = pygit2.Signature("Test", "test@example.com", parent.commit_time - 3600, 0)
+    repo.create_commit("HEAD", sig, sig, "skewed-old", parent.tree.id, [parent.id])
+
+    extended = svc.get_commits(limit=4, known=known)
+    assert [c.message for c in extended] == ["skewed-old", "m4", "m3", "m2"]
+    assert extended == svc.get_commits(limit=4)
+
+
+def test_worker_threads_get_their_own_repository(tmp_path):
+    path, _ = _repo(tmp_path)
+    shared = GitService.get_or_create(path)
+    seen = []
+    worker = threading.Thread(target=lambda: seen.extend([shared.repo, shared.repo]))
+    worker.start()
+    worker.join()
+    assert seen[0] is seen[1]  # one handle per thread
+    assert seen[0] is not shared.repo
+    assert seen[0].head.target == shared.repo.head.target
@@ -61,6 +61,56 @@ def test_porcelain_rename_populates_old_path(repo):
     assert renames[0].old_path == "a.txt"
 
 
+def test_parse_porcelain_display_name():
+    staged, unstaged = GitService._parse_porcelain(b" M src/pkg/mod.py\x00?? top.txt\x00")
+    assert staged == []
+    assert [(f.path, f.display_name) for f in unstaged] == [
+        ("src/pkg/mod.py", "mod.py"), ("top.txt", "top.txt")
+    ]
+
+
+@pytest.mark.parametrize("head, expected", [
+    ("main", ("main", "", 0, 0)),
+    ("main...origin/main", ("main", "origin/main", 0, 0)),
+    ("main...origin/main [ahead 2, behind 3]", ("main", "origin/main", 2, 3)),
+    ("main...origin/main [gone]", ("main", "", 0, 0)),
+    ("No commits yet on main", ("main", "", 0, 0)),
+    ("HEAD (no branch)", ("HEAD", "", 0, 0)),
+])
+def test_parse_branch_header(head, expected):
+    assert GitService._parse_branch_header(head) == expected
+
+
+def test_status_snapshot_tracks_upstream(repo, tmp_path):
+    d, svc = repo
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "--bare", str(remote))
+    _git(d, "remote", "add", "origin", str(remote))
+    _git(d, "push", "-u", "origin", "HEAD")
+    (d / "a.txt").write_text("next\n")
+    _git(d, "commit", "-am", "next")
+    (d / "new.txt").write_text("x\n")
+    snap = svc.get_status_snapshot()
+    assert snap.upstream.startswith("origin/")
+    assert (snap.ahead, snap.behind) == (1, 0)
+    assert snap.staged == []
+    assert [(f.path, f.status) for f in snap.unstaged] == [("new.txt", FileStatus.UNTRACKED)]
+
+
+def test_is_ignored_untracked(repo):
+    d, svc = repo
+    (d / ".gitignore").write_text("build/\n*.log\n")
+    (d / "build").mkdir()
+    (d / "forced.log").write_text("x\n")
+    _git(d, "add", "-f", "forced.log")
+    assert svc.is_ignored_untracked(str(d / "build" / "out.o")) is True
+    assert svc.is_ignored_untracked(str(d / "debug.log")) is True
+    assert svc.is_ignored_untracked(str(d / "forced.log")) is False  # tracked
+    assert svc.is_ignored_untracked(str(d / "a.txt")) is False
+    assert svc.is_ignored_untracked(str(d / ".gitignore")) is False
+    assert svc.is_ignored_untracked("/elsewhere/x.log") is False
+
+
 def test_has_uncommitted_changes_uses_porcelain(repo):
     d, svc = repo
     assert svc.has_uncommitted_changes() is False